@@ -38,6 +38,27 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config import get_path, load_config
 
+# Rows fetched per fetchmany() when streaming query results
+FETCH_CHUNK = 1000
+
+
+def _write_rows(cursor: sqlite3.Cursor, format_row) -> bool:
+    """Stream a query's rows to stdout, one write() per chunk of rows.
+
+    Rows are pulled in FETCH_CHUNK batches rather than fetchall(), so memory
+    stays bounded however large the result.
+
+    Returns:
+        False if the query returned no rows
+    """
+    rows = cursor.fetchmany(FETCH_CHUNK)
+    if not rows:
+        return False
+    while rows:
+        sys.stdout.write("".join(map(format_row, rows)))
+        rows = cursor.fetchmany(FETCH_CHUNK)
+    return True
+
 
 def connect_db(db_path: Path) -> sqlite3.Connection:
     """Connect to SQLite database."""
@@ -46,7 +67,15 @@ def connect_db(db_path: Path) -> sqlite3.Connection:
             f"Database not found: {db_path}\n"
             f"Run examples/stage1_process_photos.py first to create database."
         )
-    return sqlite3.connect(db_path)
+    # Read-only: every query here is a SELECT, so skip write locks entirely
+    conn = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro", uri=True, cached_statements=256
+    )
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
 
 
 def show_schema(conn: sqlite3.Connection):
@@ -62,7 +91,7 @@ def show_schema(conn: sqlite3.Connection):
     print("DATABASE SCHEMA")
     print(f"{'=' * 80}\n")
 
-    for table_name, sql in cursor.fetchall():
+    for table_name, sql in cursor:
         print(f"Table: {table_name}")
         print(f"{'-' * 80}")
         print(sql)
@@ -75,34 +104,43 @@ def show_all_images(conn: sqlite3.Connection, limit: int = 20):
     cursor.execute("SELECT COUNT(*) FROM images")
     total = cursor.fetchone()[0]
 
-    cursor.execute(f"""
+    cursor.execute(
+        """
         SELECT id, filename, date_taken, date_source, camera_make, camera_model
         FROM images
         ORDER BY date_taken DESC
-        LIMIT {limit}
-    """)
+        LIMIT ?
+    """,
+        (limit,),
+    )
 
     print(f"\n{'=' * 80}")
     print(f"ALL IMAGES (showing {limit} of {total})")
     print(f"{'=' * 80}\n")
 
-    for row in cursor.fetchall():
+    def format_row(row):
         img_id, filename, date, source, make, model = row
         camera = f"{make} {model}" if make else "No camera metadata"
-        print(f"ID {img_id}: {filename}")
-        print(f"  Date: {date} (source: {source})")
-        print(f"  Camera: {camera}\n")
+        return (
+            f"ID {img_id}: {filename}\n"
+            f"  Date: {date} (source: {source})\n"
+            f"  Camera: {camera}\n\n"
+        )
+
+    _write_rows(cursor, format_row)
 
 
 def show_gps_coverage(conn: sqlite3.Connection):
     """Show GPS coverage statistics."""
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) FROM images")
-    total_images = cursor.fetchone()[0]
-
-    cursor.execute("SELECT COUNT(*) FROM locations")
-    gps_images = cursor.fetchone()[0]
+    # Both counts in one statement
+    cursor.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM images),
+            (SELECT COUNT(*) FROM locations)
+    """)
+    total_images, gps_images = cursor.fetchone()
 
     coverage = (gps_images / total_images * 100) if total_images > 0 else 0
 
@@ -129,7 +167,7 @@ def show_date_sources(conn: sqlite3.Connection):
     print("DATE SOURCE BREAKDOWN")
     print(f"{'=' * 80}")
 
-    for source, count in cursor.fetchall():
+    for source, count in cursor:
         print(f"  {source}: {count} images")
 
     print(f"{'=' * 80}\n")
@@ -152,7 +190,7 @@ def show_cameras(conn: sqlite3.Connection):
     print("CAMERA BREAKDOWN")
     print(f"{'=' * 80}")
 
-    for make, model, count in cursor.fetchall():
+    for make, model, count in cursor:
         if make:
             print(f"  {make} {model}: {count} images")
         else:
@@ -181,22 +219,22 @@ def show_gps_sample(conn: sqlite3.Connection, limit: int = 10):
         (limit,),
     )
 
-    results = cursor.fetchall()
-
     print(f"\n{'=' * 80}")
     print(f"GPS DATA SAMPLE (showing {limit} most recent)")
     print(f"{'=' * 80}\n")
 
-    if not results:
-        print("No GPS data found in database\n")
-        return
-
-    for filename, date, lat, lon, alt in results:
+    def format_row(row):
+        filename, date, lat, lon, alt = row
         alt_str = f"{alt:.2f}m" if alt else "N/A"
-        print(f"📍 {filename}")
-        print(f"   Date: {date}")
-        print(f"   Coords: ({lat:.6f}, {lon:.6f})")
-        print(f"   Altitude: {alt_str}\n")
+        return (
+            f"📍 {filename}\n"
+            f"   Date: {date}\n"
+            f"   Coords: ({lat:.6f}, {lon:.6f})\n"
+            f"   Altitude: {alt_str}\n\n"
+        )
+
+    if not _write_rows(cursor, format_row):
+        print("No GPS data found in database\n")
 
 
 def show_coord_ranges(conn: sqlite3.Connection):
@@ -214,13 +252,14 @@ def show_coord_ranges(conn: sqlite3.Connection):
             MIN(altitude) as min_alt,
             MAX(altitude) as max_alt,
             AVG(altitude) as avg_alt,
+            COUNT(altitude) as alt_count,
             COUNT(*) as count
         FROM locations
     """)
 
     result = cursor.fetchone()
 
-    if not result or result[9] == 0:
+    if not result or result[10] == 0:
         print(f"\n{'=' * 80}")
         print("GEOGRAPHIC RANGE")
         print(f"{'=' * 80}")
@@ -237,6 +276,7 @@ def show_coord_ranges(conn: sqlite3.Connection):
         min_alt,
         max_alt,
         avg_alt,
+        alt_count,
         count,
     ) = result
 
@@ -258,7 +298,7 @@ def show_coord_ranges(conn: sqlite3.Connection):
     print(f"  North-South: {lat_span_km:.2f}km")
     print(f"  East-West: {lon_span_km:.2f}km")
 
-    if min_alt and max_alt and avg_alt:
+    if alt_count:
         print("\nAltitude statistics:")
         print(f"  Range: {min_alt:.2f}m to {max_alt:.2f}m")
         print(f"  Average: {avg_alt:.2f}m")
@@ -270,28 +310,27 @@ def show_missing_gps(conn: sqlite3.Connection, limit: int = 10):
     """Show sample of images without GPS data."""
     cursor = conn.cursor()
 
-    cursor.execute(f"""
+    cursor.execute(
+        """
         SELECT i.filename, i.date_taken, i.date_source
         FROM images i
-        LEFT JOIN locations l ON i.id = l.image_id
-        WHERE l.id IS NULL
+        WHERE NOT EXISTS (SELECT 1 FROM locations l WHERE l.image_id = i.id)
         ORDER BY i.date_taken DESC
-        LIMIT {limit}
-    """)
-
-    results = cursor.fetchall()
+        LIMIT ?
+    """,
+        (limit,),
+    )
 
     print(f"\n{'=' * 80}")
     print(f"IMAGES WITHOUT GPS (showing {limit})")
     print(f"{'=' * 80}\n")
 
-    if not results:
-        print("All images have GPS data!\n")
-        return
+    def format_row(row):
+        filename, date, source = row
+        return f"⏭️  {filename}\n   Date: {date} (source: {source})\n\n"
 
-    for filename, date, source in results:
-        print(f"⏭️  {filename}")
-        print(f"   Date: {date} (source: {source})\n")
+    if not _write_rows(cursor, format_row):
+        print("All images have GPS data!\n")
 
 
 # Query registry
@@ -28,8 +28,8 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn, MofNCompleteColumn
 
-from src.database import create_database, insert_image
-from src.organize import rename_and_organize
+from src.database import create_database, insert_images_many, load_processed_paths
+from src.organize import count_images, rename_and_organize
 from src.photo_details_parser import consolidate_csvs, load_photo_details
 
 console = Console()
@@ -68,9 +68,7 @@ def process_photos(
     conn = create_database(db_path)
 
     # Check what's already been processed
-    cursor = conn.cursor()
-    cursor.execute("SELECT original_path FROM images")
-    already_processed = {row[0] for row in cursor.fetchall()}
+    already_processed = load_processed_paths(conn)
 
     console.print(f"[yellow]📊 Database contains {len(already_processed)} processed images[/yellow]\n")
 
@@ -80,18 +78,38 @@ def process_photos(
         source_dir, output_dir, preserve_filenames, recursive, photo_details
     )
 
-    # Separate results by file type
-    images = [r for r in results if r["file_type"] == "image"]
-    videos = [r for r in results if r["file_type"] == "video"]
-    metadata_files = [r for r in results if r["file_type"] == "metadata"]
-    other_files = [r for r in results if r["file_type"] == "other"]
-
-    console.print(f"[green]✓ Found {len(images)} images to process[/green]\n")
+    # Consume results as they stream in: images are inserted as soon as
+    # they're organized, other file types are only counted, so nothing is
+    # accumulated per file however large the import
+    image_count = 0
+    videos = metadata_files = other_files = 0
 
     # Insert images and track progress with Rich progress bar
     new_count = 0
+    queued_count = 0
     skip_count = 0
+    error_count = 0
     SAMPLE_DISPLAY_LIMIT = 20  # Only show detailed output for first 20 files
+    INSERT_BATCH_SIZE = 500  # Rows per insert transaction
+    pending = []
+
+    def flush():
+        """Insert the pending images; only committed rows count as new."""
+        nonlocal new_count, skip_count, error_count
+        # Take the batch off the queue first, so a failing insert is reported
+        # once instead of being retried with every later batch
+        batch = pending[:]
+        pending.clear()
+        try:
+            inserted = insert_images_many(conn, batch)
+        except Exception as e:
+            console.print(f"[red]❌ Error saving {len(batch)} images: {e}[/red]")
+            error_count += len(batch)
+            return
+        new_count += inserted
+        # Rows another run stored since already_processed was loaded are
+        # skipped by the insert's ON CONFLICT DO NOTHING
+        skip_count += len(batch) - inserted
 
     with Progress(
         SpinnerColumn(),
@@ -102,45 +120,75 @@ def process_photos(
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        task = progress.add_task("[cyan]Processing images...", total=len(images))
-
-        for idx, image_data in enumerate(images, start=1):
-            filename = Path(image_data['original_path']).name
-
-            # Check if already in database
-            if image_data["original_path"] in already_processed:
-                skip_count += 1
-                progress.update(task, advance=1, description=f"[yellow]⏭️  Skipping {filename}")
-
-                # Show sample of skipped files
-                if skip_count <= SAMPLE_DISPLAY_LIMIT:
-                    progress.console.print(f"  [dim yellow]⏭️  Skip: {image_data['filename']} (already in database)[/dim yellow]")
-                elif skip_count == SAMPLE_DISPLAY_LIMIT + 1:
-                    progress.console.print(f"  [dim yellow]... and more files skipped (see progress bar)[/dim yellow]")
-                continue
-
-            # Insert new image
-            progress.update(task, description=f"[cyan]📸 Processing {filename}")
-            insert_image(conn, image_data)
-            new_count += 1
-
-            # Show sample of processed files
-            if new_count <= SAMPLE_DISPLAY_LIMIT:
-                progress.console.print(f"  [dim green]✅ {image_data['original_path'].split('/')[-1]} → {image_data['filename']}[/dim green]")
-            elif new_count == SAMPLE_DISPLAY_LIMIT + 1:
-                progress.console.print(f"  [dim green]... and more files being processed (see progress bar)[/dim green]")
-
-            progress.advance(task)
-
-    conn.close()
+        # A name-only pre-scan gives the bar its total (percentage and ETA)
+        # from the start; it's corrected below if files change mid-run
+        task = progress.add_task(
+            "[cyan]Processing images...",
+            total=count_images(source_dir, recursive),
+        )
+
+        try:
+            for image_data in results:
+                file_type = image_data["file_type"]
+                if file_type != "image":
+                    if file_type == "video":
+                        videos += 1
+                    elif file_type == "metadata":
+                        metadata_files += 1
+                    else:
+                        other_files += 1
+                    continue
+
+                image_count += 1
+                filename = Path(image_data['original_path']).name
+
+                # Check if already in database
+                if image_data["original_path"] in already_processed:
+                    skip_count += 1
+                    progress.update(task, advance=1, description=f"[yellow]⏭️  Skipping {filename}")
+
+                    # Show sample of skipped files
+                    if skip_count <= SAMPLE_DISPLAY_LIMIT:
+                        progress.console.print(f"  [dim yellow]⏭️  Skip: {image_data['filename']} (already in database)[/dim yellow]")
+                    elif skip_count == SAMPLE_DISPLAY_LIMIT + 1:
+                        progress.console.print(f"  [dim yellow]... and more files skipped (see progress bar)[/dim yellow]")
+                    continue
+
+                # Queue new image (already copied) for the next batch insert
+                progress.update(task, description=f"[cyan]📸 Processing {filename}")
+                pending.append(image_data)
+                if len(pending) >= INSERT_BATCH_SIZE:
+                    flush()
+                queued_count += 1
+
+                # Show sample of processed files
+                if queued_count <= SAMPLE_DISPLAY_LIMIT:
+                    progress.console.print(f"  [dim green]✅ {image_data['original_path'].split('/')[-1]} → {image_data['filename']}[/dim green]")
+                elif queued_count == SAMPLE_DISPLAY_LIMIT + 1:
+                    progress.console.print(f"  [dim green]... and more files being processed (see progress bar)[/dim green]")
+
+                progress.advance(task)
+        finally:
+            # Record the final partial batch - also on an error or interrupt,
+            # so files already copied into the archive are never left
+            # unrecorded - then always release the connection
+            if pending:
+                flush()
+            conn.close()
+
+        progress.update(
+            task, total=image_count, description="[green]✓ Images processed"
+        )
+
+    console.print(f"[green]✓ Found {image_count} images[/green]")
 
     # Report skipped files
     if videos:
-        console.print(f"\n[yellow]📹 {len(videos)} video files organized (metadata extraction in v0.2.0)[/yellow]")
+        console.print(f"\n[yellow]📹 {videos} video files organized (metadata extraction in v0.2.0)[/yellow]")
     if metadata_files:
-        console.print(f"[yellow]📄 Skipped {len(metadata_files)} metadata files (Photo Details CSVs, etc.)[/yellow]")
+        console.print(f"[yellow]📄 Skipped {metadata_files} metadata files (Photo Details CSVs, etc.)[/yellow]")
     if other_files:
-        console.print(f"[yellow]❓ Skipped {len(other_files)} other files[/yellow]")
+        console.print(f"[yellow]❓ Skipped {other_files} other files[/yellow]")
 
     # Summary
     console.print(f"\n[bold green]{'=' * 60}[/bold green]")
@@ -149,6 +197,8 @@ def process_photos(
     console.print(f"[green]✅ New images:[/green] {new_count}")
     if skip_count > 0:
         console.print(f"[yellow]⏭️  Skipped (already processed):[/yellow] {skip_count}")
+    if error_count > 0:
+        console.print(f"[red]❌ Not saved (database errors):[/red] {error_count}")
     console.print(f"[cyan]📊 Total in database:[/cyan] {len(already_processed) + new_count}")
 
     if new_count > 0:
@@ -57,8 +57,8 @@ Examples
 Notes
 -----
 - Idempotent: Safe to re-run, only processes images without existing GPS data
-- Incremental: Uses LEFT JOIN to find unprocessed images
-- Progress: Reports extraction success/failure for each image
+- Incremental: Uses a NOT EXISTS anti-join to find unprocessed images
+- Progress: Reports a sample of extracted coordinates plus per-image errors
 - Statistics: Shows coverage percentage at completion
 
 Author: Leonardo
@@ -66,23 +66,56 @@ Date: 2025-10-27 (Session 3-4)
 Stage: Week 2 - GPS Extraction
 """
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
 from src.config import load_config
-from src.database import create_database, insert_location, query_images_without_gps
+from src.database import (
+    create_database,
+    insert_locations_many,
+    query_images_without_gps,
+)
 from src.exif_extractor import extract_gps_coords
 
 app = typer.Typer()
 
 
+def _extract_gps_in_order(images, max_workers=None):
+    """Yield (image_id, org_path, coords) for each image, in query order.
+
+    Files are read on worker threads so their I/O overlaps, while inserts and
+    output stay with the caller. As in rename_and_organize(), only a bounded
+    window of files is in flight, so memory stays flat however many images
+    are pending.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    window = max_workers * 4
+    in_flight = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for image_id, org_path in images:
+            future = pool.submit(extract_gps_coords, org_path)
+            in_flight.append((image_id, org_path, future))
+            if len(in_flight) >= window:
+                image_id, org_path, future = in_flight.popleft()
+                yield image_id, org_path, future.result()
+
+        while in_flight:
+            image_id, org_path, future = in_flight.popleft()
+            yield image_id, org_path, future.result()
+
+
 def extract_gps(db_path):
     """Main GPS extraction pipeline.
 
     Orchestrates the complete GPS extraction workflow:
     1. Connect to database (creates locations table if needed)
-    2. Query images without GPS data (LEFT JOIN on locations table)
+    2. Query images without GPS data (NOT EXISTS on locations table)
     3. Extract GPS coordinates from each image file
     4. Insert coordinates into locations table
     5. Report extraction statistics
@@ -101,7 +134,7 @@ def extract_gps(db_path):
 
     Side Effects:
         - Creates locations table if not exists (via create_database)
-        - Inserts GPS coordinates into database (via insert_location)
+        - Inserts GPS coordinates into database (via insert_locations_many)
         - Prints progress messages to stdout
 
     Example:
@@ -128,7 +161,7 @@ def extract_gps(db_path):
     conn = create_database(db_path)
 
     # Step 2: Find images needing GPS extraction
-    # Uses LEFT JOIN to find images.id where locations.image_id IS NULL
+    # Anti-join: images.id with no matching locations.image_id
     # This query pattern enables incremental processing across all stages
     images_to_process = query_images_without_gps(conn)
 
@@ -143,34 +176,59 @@ def extract_gps(db_path):
     success_count = 0
     no_gps_count = 0
     error_count = 0
-
-    for image_id, org_path in images_to_process:
+    SAMPLE_DISPLAY_LIMIT = 20  # Only show per-image output for first 20 files
+    INSERT_BATCH_SIZE = 500  # Rows per insert transaction
+    pending = []  # ((image_id, lat, lon, alt), filename) awaiting insert
+
+    def flush():
+        """Insert the pending rows; only committed rows count as extracted."""
+        nonlocal success_count, error_count
+        # Take the batch off the queue first, so a failing insert is reported
+        # once instead of being retried by every later image
+        batch = pending[:]
+        pending.clear()
         try:
-            # Call extraction layer (pure function, no side effects)
-            coords = extract_gps_coords(org_path)
-
-            if coords:
-                lat, lon, alt = coords
-
-                # Call persistence layer (database.py handles SQL)
-                insert_location(conn, image_id, lat, lon, alt)
-
-                # Progress indicator with rounded altitude display
-                filename = Path(org_path).name
+            # Call persistence layer (database.py handles SQL)
+            insert_locations_many(conn, [row for row, _ in batch])
+        except Exception as e:
+            print(f"❌ Error saving {len(batch)} GPS records: {e}")
+            error_count += len(batch)
+            return
+
+        for (_, lat, lon, alt), filename in batch:
+            success_count += 1
+            # Show sample of extracted coordinates (one write per image is
+            # costly on large libraries - the summary reports the totals)
+            if success_count <= SAMPLE_DISPLAY_LIMIT:
                 alt_str = f", {alt:.2f}m" if alt else ""
                 print(f"✅ {filename}: ({lat:.6f}, {lon:.6f}{alt_str})")
-                success_count += 1
-            else:
-                # Not an error - image just lacks GPS data
-                # (Location services off, screenshot, edited photo, etc.)
-                no_gps_count += 1
+            elif success_count == SAMPLE_DISPLAY_LIMIT + 1:
+                print("... and more images extracted (see summary)")
 
-        except Exception as e:
-            # Log error but continue processing other images
-            print(f"❌ Error processing image {image_id}: {e}")
-            error_count += 1
-
-    conn.close()
+    try:
+        for image_id, org_path, coords in _extract_gps_in_order(images_to_process):
+            try:
+                if coords:
+                    lat, lon, alt = coords
+                    row = (image_id, lat, lon, alt)
+                    pending.append((row, Path(org_path).name))
+                    if len(pending) >= INSERT_BATCH_SIZE:
+                        flush()
+                else:
+                    # Not an error - image just lacks GPS data
+                    # (Location services off, screenshot, edited photo, etc.)
+                    no_gps_count += 1
+
+            except Exception as e:
+                # Log error but continue processing other images
+                print(f"❌ Error processing image {image_id}: {e}")
+                error_count += 1
+    finally:
+        # Save the final partial batch - also on an interrupt, so coordinates
+        # already extracted aren't lost - then always release the connection
+        if pending:
+            flush()
+        conn.close()
 
     # Step 4: Report statistics
     total = len(images_to_process)
@@ -18,13 +18,24 @@ Architecture:
     - Validation: Clear error messages for configuration issues
 """
 
+from collections.abc import Mapping
+from contextlib import nullcontext
+from functools import cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TextIO
 
 import yaml
 from platformdirs import user_cache_dir, user_config_dir, user_data_dir
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
+
+@cache
 def get_default_config_path() -> Path:
     """Get platform-appropriate config file location.
 
@@ -39,12 +50,17 @@ def get_default_config_path() -> Path:
     Example:
         >>> get_default_config_path()
         PosixPath('/home/user/.config/photo-pipeline/config.yaml')
+
+    Notes:
+        Cached for the process lifetime; call get_default_config_path.cache_clear()
+        after changing HOME/XDG_* environment variables.
     """
     config_dir = Path(user_config_dir("photo-pipeline", appauthor=False))
     return config_dir / "config.yaml"
 
 
-def get_default_paths() -> dict[str, Path]:
+@cache
+def get_default_paths() -> Mapping[str, Path]:
     """Get platform-appropriate default paths for data storage.
 
     Provides sensible defaults using platformdirs when config.yaml doesn't exist
@@ -52,7 +68,7 @@ def get_default_paths() -> dict[str, Path]:
     conventions on macOS, and Windows AppData patterns.
 
     Returns:
-        Dict[str, Path]: Dictionary with keys:
+        Mapping[str, Path]: Read-only mapping with keys:
             - input_directory: User's Pictures directory
             - output_directory: App data dir for organized photos
             - database: App data dir for SQLite database
@@ -66,6 +82,10 @@ def get_default_paths() -> dict[str, Path]:
     Notes:
         These are fallback defaults. Users should still create config.yaml
         for production use to specify exact paths.
+
+        The result is cached for the process lifetime and shared between
+        callers, hence read-only; call get_default_paths.cache_clear() after
+        changing HOME/XDG_* environment variables.
     """
     data_dir = Path(user_data_dir("photo-pipeline", appauthor=False))
     cache_dir = Path(user_cache_dir("photo-pipeline", appauthor=False))
@@ -73,22 +93,26 @@ def get_default_paths() -> dict[str, Path]:
     # Use ~/Pictures as default input (fallback to home if Pictures doesn't exist)
     pictures_dir = Path.home() / "Pictures"
 
-    return {
-        "input_directory": pictures_dir if pictures_dir.exists() else Path.home(),
-        "output_directory": data_dir / "organized",
-        "database": data_dir / "photo_archive.db",
-        "model_cache": cache_dir / "models",
-    }
+    return MappingProxyType(
+        {
+            "input_directory": pictures_dir if pictures_dir.exists() else Path.home(),
+            "output_directory": data_dir / "organized",
+            "database": data_dir / "photo_archive.db",
+            "model_cache": cache_dir / "models",
+        }
+    )
 
 
-def load_config(config_path: str | None = None) -> dict[str, Any]:
+def load_config(config_path: str | Path | TextIO | None = None) -> dict[str, Any]:
     """Load configuration from YAML file with path expansion and validation.
 
     Loads user-specific configuration including paths, processing parameters,
     and model settings. Uses platformdirs for cross-platform defaults.
 
     Args:
-        config_path (Optional[str]): Path to YAML config file. If None, attempts:
+        config_path (Optional[str | Path | TextIO]): Path to YAML config file,
+            or an already-open text stream (e.g. io.StringIO) to parse as-is.
+            If None, attempts:
             1. ./config.yaml (current directory)
             2. Platform-specific config directory via platformdirs
             If not found, uses platform-appropriate defaults.
@@ -137,7 +161,12 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         4. Built-in defaults (no file required)
     """
     # Determine which config file to use
-    if config_path:
+    config_stream = None
+    if hasattr(config_path, "read"):
+        # Caller-supplied stream - parse directly, no filesystem lookup
+        config_stream = config_path
+        config_file = getattr(config_path, "name", "<stream>")
+    elif config_path:
         # Explicit path provided
         config_file = Path(config_path).expanduser()
         if not config_file.exists():
@@ -161,8 +190,13 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
     # If config exists, load it
     if config_file:
         try:
-            with open(config_file) as f:
-                config = yaml.safe_load(f) or {}
+            source = (
+                nullcontext(config_stream)
+                if config_stream is not None
+                else open(config_file)
+            )
+            with source as f:
+                config = yaml.load(f, Loader=_SafeLoader) or {}
         except yaml.YAMLError as e:
             raise yaml.YAMLError(
                 f"Error parsing config file {config_file}:\n{e}\n\n"
@@ -1,5 +1,71 @@
 # src/database.py
 import sqlite3
+from operator import itemgetter
+
+
+def _apply_pragmas(conn, db_path):
+    """Tune a connection for the pipeline's insert-heavy workload.
+
+    WAL appends commits to a log instead of rewriting pages through a
+    rollback journal, and with WAL, synchronous=NORMAL is still
+    corruption-safe (a power loss can only drop the most recent commits).
+    Skipped for in-memory databases, which have no journal to tune.
+    """
+    if str(db_path) == ":memory:":
+        return
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+
+
+# Duplicate image rows (same original_path) mapped to the row kept for them,
+# the lowest id - the first time the file was recorded
+_MERGE_DUPLICATE_IMAGES_SQL = (
+    """
+    CREATE TEMP TABLE duplicate_images AS
+    SELECT i.id AS duplicate_id, k.keep_id
+    FROM images i
+    JOIN (
+        SELECT original_path, MIN(id) AS keep_id
+        FROM images
+        GROUP BY original_path
+        HAVING COUNT(*) > 1
+    ) k ON k.original_path = i.original_path
+    WHERE i.id <> k.keep_id
+    """,
+    # Move the duplicates' GPS rows onto the kept image...
+    """
+    UPDATE locations
+    SET image_id = (
+        SELECT keep_id FROM duplicate_images WHERE duplicate_id = locations.image_id
+    )
+    WHERE image_id IN (SELECT duplicate_id FROM duplicate_images)
+    """,
+    # ...keeping one per kept image (they describe the same file)
+    """
+    DELETE FROM locations
+    WHERE image_id IN (SELECT keep_id FROM duplicate_images)
+      AND id NOT IN (
+          SELECT MIN(id) FROM locations
+          WHERE image_id IN (SELECT keep_id FROM duplicate_images)
+          GROUP BY image_id
+      )
+    """,
+    "DELETE FROM images WHERE id IN (SELECT duplicate_id FROM duplicate_images)",
+    "DROP TABLE duplicate_images",
+)
+
+
+def _merge_duplicate_images(cursor):
+    """Collapse images rows sharing an original_path into the lowest id.
+
+    Needed before idx_original_path can be created on archives written
+    before it existed, when re-runs could insert the same file twice.
+    """
+    for sql in _MERGE_DUPLICATE_IMAGES_SQL:
+        cursor.execute(sql)
 
 
 def create_database(db_path="photo_archive.db"):
@@ -8,7 +74,7 @@ def create_database(db_path="photo_archive.db"):
     Returns connection object.
     """
     # conn object represents established connection, acting as the link between your Python program and the database
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=256)
     # cursor object = control structure that allows you to execute SQL commands and manage the results within the context of that database connection
     cursor = conn.cursor()
     # create a table (like a spreadsheet)
@@ -32,6 +98,11 @@ def create_database(db_path="photo_archive.db"):
         ON images(date_taken)
     """)
 
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_date_source
+        ON images(date_source)
+    """)
+
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_camera
         ON images(camera_make, camera_model)
@@ -59,72 +130,152 @@ def create_database(db_path="photo_archive.db"):
         ON locations(latitude, longitude)
     """)
 
+    # One row per source file; also the conflict target for inserts.
+    # Archives created before this index may hold duplicate rows, which
+    # would make it fail - merge those first (once, while it's missing)
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+        ("idx_original_path",),
+    )
+    if cursor.fetchone() is None:
+        _merge_duplicate_images(cursor)
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_original_path
+        ON images(original_path)
+    """)
+
     conn.commit()
+    _apply_pragmas(conn, db_path)
+
+    # Rows support row["column"] as well as tuple indexing/unpacking
+    conn.row_factory = sqlite3.Row
     return conn
 
 
 # Image helper functions
+_INSERT_IMAGE_SQL = """
+    INSERT INTO images (
+        original_path,
+        organized_path,
+        filename,
+        date_taken,
+        date_source,
+        camera_make,
+        camera_model
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(original_path) DO NOTHING
+"""
+
+_QUERY_IMAGE_ID_SQL = "SELECT id FROM images WHERE original_path = ?"
+
+_image_paths = itemgetter("original_path", "organized_path", "filename")
+_image_source = itemgetter("date_source", "camera_make", "camera_model")
+
+
+def _image_row(image_data):
+    """Flatten an image dict into the _INSERT_IMAGE_SQL parameter tuple."""
+    # Convert datetime to string if present
+    date_taken = image_data.get("date_taken")
+    date_str = date_taken.strftime("%Y-%m-%d %H:%M:%S") if date_taken else None
+    return (*_image_paths(image_data), date_str, *_image_source(image_data))
+
+
 def insert_image(conn, image_data):
     """Insert image metadata into database.
 
+    Re-inserting an original_path that's already stored is a no-op; the
+    unique index does the duplicate check within the INSERT itself.
+
     Args:
         conn: SQLite connection
         image_data: dict from rename_and_organize() results
 
-    Returns: image_id (int)
+    Returns: image_id (int) - the existing row's id for a duplicate
     """
     cursor = conn.cursor()
+    cursor.execute(_INSERT_IMAGE_SQL, _image_row(image_data))
+    conn.commit()
 
-    # Convert datetime to string if present
-    date_str = None
-    if image_data.get("date_taken"):
-        date_str = image_data["date_taken"].strftime("%Y-%m-%d %H:%M:%S")
+    if cursor.rowcount == 0:
+        cursor.execute(_QUERY_IMAGE_ID_SQL, (image_data["original_path"],))
+        return cursor.fetchone()[0]
+    return cursor.lastrowid
 
-    cursor.execute(
-        """
-        INSERT INTO images (
-            original_path,
-            organized_path,
-            filename,
-            date_taken,
-            date_source,
-            camera_make,
-            camera_model
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """,
-        (
-            image_data["original_path"],
-            image_data["organized_path"],
-            image_data["filename"],
-            date_str,
-            image_data["date_source"],
-            image_data["camera_make"],
-            image_data["camera_model"],
-        ),
-    )
 
-    conn.commit()
-    return cursor.lastrowid
+def insert_images_many(conn, images):
+    """Insert many images in a single transaction.
 
+    One executemany() and one commit for the whole batch, instead of a
+    statement and commit per row. If any row fails, none are inserted.
+    Rows whose original_path is already stored are skipped.
 
-def query_by_date_range(conn, start_date, end_date):
+    Args:
+        conn: SQLite connection
+        images: iterable of dicts from rename_and_organize() results
+
+    Returns: number of rows inserted (int), excluding skipped duplicates
+    """
+    with conn:
+        cursor = conn.executemany(_INSERT_IMAGE_SQL, map(_image_row, images))
+    return cursor.rowcount
+
+
+_QUERY_BY_DATE_RANGE_SQL = """
+    SELECT * FROM images
+    WHERE date_taken BETWEEN ? AND ?
+    ORDER BY date_taken
+"""
+
+# idx_date_taken yields rows already in order, so LIMIT stops the scan early
+_QUERY_BY_DATE_RANGE_LIMIT_SQL = _QUERY_BY_DATE_RANGE_SQL + "    LIMIT ?\n"
+
+_QUERY_BY_MAKE_MODEL_SQL = """
+    SELECT * FROM images
+    WHERE camera_make = ? AND camera_model = ?
+"""
+
+_QUERY_BY_MAKE_SQL = """
+    SELECT * FROM images
+    WHERE camera_make = ?
+"""
+
+_QUERY_ALL_IMAGES_SQL = "SELECT * FROM images"
+
+_QUERY_ORIGINAL_PATHS_SQL = "SELECT original_path FROM images"
+
+
+def load_processed_paths(conn):
+    """Load every stored original_path, for skipping already-imported files.
+
+    Built once per run with a single streamed scan, so duplicate checks are
+    O(1) set lookups instead of a query per file.
+
+    Returns: set of original_path strings
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None  # Plain tuples - one per stored image
+    cursor.arraysize = 10_000  # Rows per underlying fetch while streaming
+    cursor.execute(_QUERY_ORIGINAL_PATHS_SQL)
+    return {path for (path,) in cursor}
+
+
+def query_by_date_range(conn, start_date, end_date, limit=None):
     """Query images within date range.
 
     Args:
         start_date, end_date: datetime objects or strings 'YYYY-MM-DD'
+        limit: Return at most this many images, earliest first (default: all)
 
     Returns: list of image records
     """
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM images
-        WHERE date_taken BETWEEN ? AND ?
-        ORDER BY date_taken
-    """,
-        (str(start_date), str(end_date)),
-    )
+    if limit is None:
+        cursor.execute(_QUERY_BY_DATE_RANGE_SQL, (str(start_date), str(end_date)))
+    else:
+        cursor.execute(
+            _QUERY_BY_DATE_RANGE_LIMIT_SQL, (str(start_date), str(end_date), limit)
+        )
 
     return cursor.fetchall()
 
@@ -134,49 +285,55 @@ def query_by_camera(conn, make=None, model=None):
     cursor = conn.cursor()
 
     if make and model:
-        cursor.execute(
-            """
-            SELECT * FROM images
-            WHERE camera_make = ? AND camera_model = ?
-        """,
-            (make, model),
-        )
+        cursor.execute(_QUERY_BY_MAKE_MODEL_SQL, (make, model))
     elif make:
-        cursor.execute(
-            """
-            SELECT * FROM images
-            WHERE camera_make = ?
-        """,
-            (make,),
-        )
+        cursor.execute(_QUERY_BY_MAKE_SQL, (make,))
     else:
-        cursor.execute("SELECT * FROM images")
+        cursor.execute(_QUERY_ALL_IMAGES_SQL)
 
     return cursor.fetchall()
 
 
 # GPS helper functions
+_INSERT_LOCATION_SQL = """
+    INSERT INTO locations (image_id, latitude, longitude, altitude)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Anti-join: each probe stops at the first idx_image_location hit
+_QUERY_WITHOUT_GPS_SQL = """
+    SELECT i.id, i.organized_path
+    FROM images i
+    WHERE NOT EXISTS (SELECT 1 FROM locations l WHERE l.image_id = i.id)
+"""
+
+
 def insert_location(conn, image_id, lat, lon, alt=None):
     """Insert GPS coordinates into locations table."""
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        INSERT INTO locations (image_id, latitude, longitude, altitude)
-        VALUES (?, ?, ?, ?)
-    """,
-        (image_id, lat, lon, alt),
-    )
+    cursor.execute(_INSERT_LOCATION_SQL, (image_id, lat, lon, alt))
     conn.commit()
     return cursor.lastrowid
 
 
+def insert_locations_many(conn, rows):
+    """Insert many GPS coordinates in a single transaction.
+
+    Args:
+        conn: SQLite connection
+        rows: iterable of (image_id, lat, lon, alt) tuples; consumed lazily,
+            so a generator is never materialised
+
+    Returns: number of rows inserted (int)
+    """
+    with conn:
+        cursor = conn.executemany(_INSERT_LOCATION_SQL, rows)
+    return cursor.rowcount
+
+
 def query_images_without_gps(conn):
     """Find images that haven't been GPS processed yet."""
     cursor = conn.cursor()
-    cursor.execute("""
-        SELECT i.id, i.organized_path
-        FROM images i
-        LEFT JOIN locations l ON i.id = l.image_id
-        WHERE l.id IS NULL
-    """)
+    cursor.row_factory = None  # Plain (id, path) tuples for the bulk scan
+    cursor.execute(_QUERY_WITHOUT_GPS_SQL)
     return cursor.fetchall()
@@ -12,18 +12,115 @@ Separation of concerns:
 - Raises exceptions for error handling (caught by orchestration)
 """
 
+import itertools
+import os
+import re
 import shutil
+import stat
+import sys
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from src.exif_extractor import extract_camera_info, extract_exif_date
+from src.exif_extractor import _fallback_date, extract_metadata
 
+if sys.platform.startswith("linux"):
+    import fcntl
 
+    # ioctl that reflinks (copy-on-write clones) one file onto another on
+    # btrfs/XFS; only exposed as fcntl.FICLONE from Python 3.12
+    _FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+else:
+    fcntl = None
+
+_COPY_BUFSIZE = 1024 * 1024  # 1 MiB
+
+# Numbers each staged copy; next() on a count is atomic under the GIL, so
+# names stay unique across a process's worker threads
+_staged_ids = itertools.count()
+
+# Leading signatures of supported image formats (JPEG, PNG). HEIF containers
+# (HEIC) are identified by their ftyp box brand at bytes 4-12 instead, and
+# WebP by its RIFF/WEBP chunk ids.
+_IMAGE_MAGIC = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n")
+_HEIF_BRANDS = frozenset(
+    {
+        b"ftypheic",
+        b"ftypheix",
+        b"ftypheim",
+        b"ftypheis",
+        b"ftyphevc",
+        b"ftypmif1",
+        b"ftypmsf1",
+    }
+)
+
+
+def _looks_like_image(file_path) -> bool:
+    """Check whether a file's first 12 bytes match a supported image format.
+
+    Lets truncated downloads and corrupted files skip the EXIF parse instead
+    of failing inside Pillow's decoder. Reads through a raw descriptor with
+    one os.read, so no Python file object or read buffer is set up.
+
+    Args:
+        file_path: Path to file (str or Path)
+
+    Returns:
+        bool: False if the header matches no supported image format
+              (corrupted, truncated, or unreadable)
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        header = os.read(fd, 12)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+    return (
+        header.startswith(_IMAGE_MAGIC)
+        or header[4:12] in _HEIF_BRANDS
+        or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")
+    )
+
+
+# Pure camera/auto-generated filename patterns (NO additional descriptive
+# content), compiled once into a single alternation so each stem is scanned
+# by one regex instead of one per pattern.
+_CAMERA_NAME_RE = re.compile(
+    r"^(?:"
+    r"IMG_\d+$"  # IMG_1234
+    r"|DSC[N]?\d+$"  # DSC01234, DSCN1234
+    r"|\d{8}_\d{6}$"  # 20231215_143022 (pure timestamp)
+    r"|\d{4}-\d{2}-\d{2}_\d{6}$"  # 2023-12-15_143022 (already organized)
+    r"|\d{1,8}$"  # 2990, 0001 (bare camera counters)
+    r"|IMG-\d+"  # IMG-20231215-WA0001
+    r"|PXL_"  # Pixel phone format (PXL_20231215_143022)
+    # Screenshot 2025-07-06 121830 or at 12:18:30 (no description)
+    r"|Screenshot \d{4}-\d{2}-\d{2}(?:(?: at)? \d{2}[:-]?\d{2}[:-]?\d{2})?$"
+    r"|Screenshot_\d+$"  # Screenshot_20231215
+    r"|\d{4}-\d{2}-\d{2} \d{6}$"  # 2025-09-02 200936 (pure timestamp, no description)
+    # iCloud UUID exports
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+    r")",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=16384)  # Live Photo / HEIC+JPG siblings repeat stems
 def _is_descriptive_name(stem: str) -> bool:
     """Check if filename is descriptive vs camera-generated.
 
     Camera-generated patterns include:
     - IMG_1234, DSC01234, DSCN1234
+    - Bare counters up to 8 digits (2990, 0001)
     - Pure timestamp screenshots (Screenshot 2025-07-06 121830)
     - Date-only filenames (2023-12-15_143022)
 
@@ -38,27 +135,48 @@ def _is_descriptive_name(stem: str) -> bool:
     Returns:
         True if filename appears descriptive/meaningful
     """
-    import re
-
-    # Pure camera/auto-generated patterns (NO additional descriptive content)
-    camera_patterns = [
-        r"^IMG_\d+$",  # IMG_1234
-        r"^DSC[N]?\d+$",  # DSC01234, DSCN1234
-        r"^\d{8}_\d{6}$",  # 20231215_143022 (pure timestamp)
-        r"^\d{4}-\d{2}-\d{2}_\d{6}$",  # 2023-12-15_143022 (already organized)
-        r"^IMG-\d+",  # IMG-20231215-WA0001
-        r"^PXL_",  # Pixel phone format (PXL_20231215_143022)
-        r"^Screenshot \d{4}-\d{2}-\d{2}(( at)? \d{2}[:-]?\d{2}[:-]?\d{2})?$",  # Screenshot 2025-07-06 121830 or at 12:18:30 (no description)
-        r"^Screenshot_\d+$",  # Screenshot_20231215
-        r"^\d{4}-\d{2}-\d{2} \d{6}$",  # 2025-09-02 200936 (pure timestamp, no description)
-        r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",  # iCloud UUID exports
-    ]
-
-    return not any(
-        re.match(pattern, stem, re.IGNORECASE) for pattern in camera_patterns
+    # Fast path for the most common camera names - exact equivalents of their
+    # regex alternatives using C-level string checks
+    if stem.isdecimal() and len(stem) <= 8:
+        return False  # Bare counter (2990.HEIC, Canon 0001.CR2)
+    head = stem[:4].upper()
+    if head == "PXL_":
+        return False
+    if head == "IMG_" and stem[4:].isdecimal():
+        return False
+    if head == "IMG-" and stem[4:5].isdecimal():
+        return False
+    if head.startswith("DSC") and (
+        stem[3:].isdecimal() or (head == "DSCN" and stem[4:].isdecimal())
+    ):
+        return False
+
+    return _CAMERA_NAME_RE.match(stem) is None
+
+
+# Timestamp prefixes that may be followed by a description. Each pattern
+# has a capture group for the description part; tried in order.
+_TIMESTAMP_DESCRIPTION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # Screenshot with flexible separators (matches exif_extractor.py pattern)
+        # Captures description after timestamp, excluding am/pm suffix
+        r"^Screenshot[\s\-_]+(?:from[\s\-_]+)?\d{4}-\d{2}-\d{2}[\s\-_]+(?:at[\s\-_]+)?\d{2}[\.\-:]\d{2}[\.\-:]\d{2}[\s\-_]*(?:am|pm)?[\s\-_]*(.+)$",
+        # YYYY-MM-DD HHMMSS description
+        r"^\d{4}-\d{2}-\d{2}\s+\d{6}\s+(.+)$",
+        # YYYY-MM-DD_HHMMSS description
+        r"^\d{4}-\d{2}-\d{2}_\d{6}\s+(.+)$",
+        # YYYYMMDD_HHMMSS description
+        r"^\d{8}_\d{6}\s+(.+)$",
     )
+)
+
+# YYMMDD_HHMM manual timestamps, at the start or end of the name
+_YYMMDD_PREFIX_RE = re.compile(r"^\d{6}_\d{4}_(.+)$")  # YYMMDD_HHMM_description
+_YYMMDD_SUFFIX_RE = re.compile(r"^(.+)_\d{6}_\d{4}$")  # description_YYMMDD_HHMM
 
 
+@lru_cache(maxsize=16384)  # Called right after _is_descriptive_name on the same stem
 def _extract_description_from_timestamped_name(stem: str) -> str | None:
     """Extract description from filename that already has a timestamp prefix.
 
@@ -77,41 +195,25 @@ def _extract_description_from_timestamped_name(stem: str) -> str | None:
     Returns:
         Description text if found, None if filename is pure timestamp or no timestamp
     """
-    import re
-
-    # Patterns that match timestamp prefixes with potential descriptions
-    # Each pattern has a capture group for the description part
-    timestamp_patterns = [
-        # Screenshot with flexible separators (matches exif_extractor.py pattern)
-        # Captures description after timestamp, excluding am/pm suffix
-        r"^Screenshot[\s\-_]+(?:from[\s\-_]+)?\d{4}-\d{2}-\d{2}[\s\-_]+(?:at[\s\-_]+)?\d{2}[\.\-:]\d{2}[\.\-:]\d{2}[\s\-_]*(?:am|pm)?[\s\-_]*(.+)$",
-        # YYYY-MM-DD HHMMSS description
-        r"^\d{4}-\d{2}-\d{2}\s+\d{6}\s+(.+)$",
-        # YYYY-MM-DD_HHMMSS description
-        r"^\d{4}-\d{2}-\d{2}_\d{6}\s+(.+)$",
-        # YYYYMMDD_HHMMSS description
-        r"^\d{8}_\d{6}\s+(.+)$",
-    ]
-
-    for pattern in timestamp_patterns:
-        match = re.match(pattern, stem, re.IGNORECASE)
+    for pattern in _TIMESTAMP_DESCRIPTION_RES:
+        match = pattern.match(stem)
         if match:
             # Get the first (and only) capture group (description)
             description = match.group(1).strip()
             # Only return if there's actual descriptive content (not just am/pm)
-            if description and description.lower() not in ['am', 'pm']:
+            if description and description.lower() not in ["am", "pm"]:
                 return description
 
     # YYMMDD_HHMM pattern - can be at beginning or end
     # Pattern: YYMMDD_HHMM_description → description
-    match = re.match(r"^\d{6}_\d{4}_(.+)$", stem)
+    match = _YYMMDD_PREFIX_RE.match(stem)
     if match:
         description = match.group(1).strip()
         if description:
             return description
 
     # Pattern: description_YYMMDD_HHMM → description
-    match = re.match(r"^(.+)_\d{6}_\d{4}$", stem)
+    match = _YYMMDD_SUFFIX_RE.match(stem)
     if match:
         description = match.group(1).strip()
         if description:
@@ -120,6 +222,11 @@ def _extract_description_from_timestamped_name(stem: str) -> str | None:
     return None
 
 
+# Date sources that can't be trusted as capture time - routed to
+# filesystem_dates/ for manual review instead of a year directory
+_UNRELIABLE_DATE_SOURCES = frozenset({"filesystem", "exif_datetime_unknown"})
+
+
 def generate_organized_path(
     date,
     source_type,
@@ -153,20 +260,23 @@ def generate_organized_path(
         - 'photos/filesystem_dates/2025-11-23_095802_piazza-dei-signori.jpg'
         - 'videos/unsorted/corrupted-file.mov'
     """
-    # Extract original stem (without extension) and extension
-    original_path = Path(original_filename)
-    ext = original_path.suffix.lower()
-    original_stem = original_path.stem
-
     # Determine media subdirectory (photos/ or videos/)
     media_dir = "photos" if media_type == "image" else "videos"
 
     # Case 1: No date at all (corrupted/unreadable)
     if date is None:
-        return Path(media_dir) / "unsorted" / original_filename
+        return Path(f"{media_dir}/unsorted/{original_filename}")
 
-    # Generate timestamp
-    timestamp = date.strftime("%Y-%m-%d_%H%M%S")
+    # Extract original stem (without extension) and extension (plain string
+    # split - no need to build a Path just to read two attributes)
+    original_stem, ext = os.path.splitext(original_filename)
+    ext = ext.lower()
+
+    # Generate timestamp (f-string formatting avoids strftime's locale machinery)
+    timestamp = (
+        f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+        f"_{date.hour:02d}{date.minute:02d}{date.second:02d}"
+    )
 
     # Determine if we should preserve the original filename
     should_preserve = False
@@ -194,12 +304,199 @@ def generate_organized_path(
         filename = f"{timestamp}{ext}"
 
     # Case 2: Filesystem date (unreliable - needs manual review)
-    if source_type in ["filesystem", "exif_datetime_unknown"]:
-        return Path(media_dir) / "filesystem_dates" / filename
+    if source_type in _UNRELIABLE_DATE_SOURCES:
+        return Path(f"{media_dir}/filesystem_dates/{filename}")
 
     # Case 3: Reliable date (EXIF or filename timestamp)
-    year = date.strftime("%Y")
-    return Path(media_dir) / year / filename
+    year = timestamp[:4]
+    return Path(f"{media_dir}/{year}/{filename}")
+
+
+# Supported formats (matched against the lowercased suffix)
+_IMAGE_SUFFIXES = frozenset({".heic", ".jpg", ".jpeg", ".png", ".webp"})
+_VIDEO_SUFFIXES = frozenset({".mov", ".mp4", ".avi", ".mkv"})
+_METADATA_SUFFIXES = frozenset({".csv", ".txt", ".json"})
+
+
+def _iter_source_files(source: Path, recursive: bool):
+    """Yield paths of files in source, optionally descending into subdirectories.
+
+    Uses os.scandir so file/directory checks come from the directory entry
+    type the OS already returned, instead of a stat() per entry.
+    """
+    pending = deque([source])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except PermissionError:
+            if directory is source:
+                raise
+            # Unreadable subdirectory - skipped, as Path.rglob() does
+
+
+def _organize_one(
+    file_path: Path,
+    dest: Path,
+    preserve_filenames,
+    photo_details: dict | None,
+    created_dirs: set,
+) -> tuple[dict, Path | None]:
+    """Stage a single file's copy into dest and return its result dict.
+
+    Runs on a rename_and_organize() worker thread or process. Media files are
+    copied to a private temp name beside their organized path, returned
+    alongside the result for _place() to move into place; other files get
+    None.
+    """
+    suffix = file_path.suffix.lower()
+
+    # Check if supported media type
+    is_image = suffix in _IMAGE_SUFFIXES
+    is_video = suffix in _VIDEO_SUFFIXES
+
+    if is_image or is_video:
+        # Determine media type
+        media_type = "image" if is_image else "video"
+
+        if is_image and not _looks_like_image(file_path):
+            # Header doesn't match any image format (partial download,
+            # corrupted file) - skip the EXIF open, but still date the file
+            # from Photo Details, its filename or its mtime
+            date, source_type = _fallback_date(file_path, photo_details)
+            camera = {"make": None, "model": None}
+        else:
+            # Extract metadata (with optional Photo Details for improved dates)
+            # from a single open/parse of the file
+            date, source_type, camera = extract_metadata(file_path, photo_details)
+
+        # Generate organized path
+        rel_path = generate_organized_path(
+            date, source_type, file_path.name, preserve_filenames, media_type
+        )
+        new_path = dest / rel_path
+
+        # Create directory if needed (mkdir is idempotent, so a race between
+        # workers just costs a redundant call)
+        parent = new_path.parent
+        if parent not in created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(parent)
+
+        # Copy file (don't delete original yet - safety) to a temp name of
+        # its own - a worker may stage several files for one organized name
+        # before they're placed - which _place() renames in scan order
+        tmp_path = parent / f".{new_path.name}.{os.getpid()}.{next(_staged_ids)}.part"
+        try:
+            _fastcopy(file_path, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return {
+            "original_path": str(file_path),
+            "organized_path": str(new_path),
+            "filename": new_path.name,
+            "date_taken": date,
+            "date_source": source_type,
+            "camera_make": camera["make"],
+            "camera_model": camera["model"],
+            "file_type": media_type,  # 'image' or 'video'
+            "processed": True,
+        }, tmp_path
+
+    # Track non-media files for orchestration reporting
+    file_type = "metadata" if suffix in _METADATA_SUFFIXES else "other"
+
+    return {
+        "original_path": str(file_path),
+        "organized_path": None,
+        "filename": file_path.name,
+        "date_taken": None,
+        "date_source": None,
+        "camera_make": None,
+        "camera_model": None,
+        "file_type": file_type,
+        "processed": False,
+    }, None
+
+
+# Arguments shared by every task in a use_processes worker, installed once by
+# the pool initializer so photo_details isn't pickled with each file
+_process_worker_args: tuple | None = None
+
+
+def _init_process_worker(dest: Path, preserve_filenames, photo_details) -> None:
+    """ProcessPoolExecutor initializer for rename_and_organize(use_processes=True)."""
+    global _process_worker_args
+    # Each process keeps its own created-directories set
+    _process_worker_args = (dest, preserve_filenames, photo_details, set())
+
+
+def _place(future) -> dict:
+    """Move a finished file's staged copy to its organized path.
+
+    Called in scan order, so when several files map to the same organized
+    name the last one scanned wins - as with the original sequential loop -
+    however the workers were scheduled.
+    """
+    result, tmp_path = future.result()
+    if tmp_path is not None:
+        try:
+            os.replace(tmp_path, result["organized_path"])
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return result
+
+
+def _discard(futures) -> None:
+    """Cancel unplaced files, deleting staged copies of any already run."""
+    for future in futures:
+        future.cancel()
+    for future in futures:
+        if future.cancelled():
+            continue
+        try:
+            _, tmp_path = future.result()
+        except Exception:
+            continue  # The worker already removed its temp copy
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _organize_one_in_process(file_path: Path) -> tuple[dict, Path | None]:
+    """Organize a single file using the worker's initializer arguments."""
+    return _organize_one(file_path, *_process_worker_args)
+
+
+def count_images(source_dir, recursive=False) -> int:
+    """Count the files rename_and_organize() will treat as images.
+
+    A name-only walk (no stat, no file opens), so callers can size a progress
+    bar before organizing starts. Images are matched by suffix, exactly as
+    rename_and_organize() classifies them.
+
+    Args:
+        source_dir: Source directory with images and videos
+        recursive: Count subdirectories too, as in rename_and_organize()
+
+    Returns:
+        int: Number of image files, 0 if source_dir doesn't exist
+    """
+    source = Path(source_dir)
+    if not source.exists():
+        return 0
+    return sum(
+        1
+        for file_path in _iter_source_files(source, recursive)
+        if os.path.splitext(file_path.name)[1].lower() in _IMAGE_SUFFIXES
+    )
 
 
 def rename_and_organize(
@@ -208,15 +505,25 @@ def rename_and_organize(
     preserve_filenames="descriptive_only",
     recursive=False,
     photo_details: dict | None = None,
+    max_workers: int | None = None,
+    use_processes: bool = False,
 ):
     """Process all images and videos in source_dir, organize into dest_dir.
 
     This is a pure data processing function - no user output.
     Orchestration layer handles progress reporting.
 
+    Results are yielded one file at a time so large imports don't hold every
+    result dict in memory; wrap in list() if random access is needed.
+
     Media organization:
     - Images → photos/ subdirectory (organized by date)
     - Videos → videos/ subdirectory (organized by date)
+    - Images whose file header doesn't match a known image format
+      (truncated/corrupted) skip the EXIF read and are dated from Photo
+      Details, their filename or mtime instead
+    - Files mapping to the same organized name overwrite each other in scan
+      order (the last one scanned wins), regardless of worker scheduling
 
     Args:
         source_dir: Source directory with images and videos
@@ -231,9 +538,15 @@ def rename_and_organize(
         photo_details: Optional dict from photo_details_parser.load_photo_details()
             - Provides iCloud canonical dates for photos without EXIF
             - Particularly helpful for screenshots and edited photos
-
-    Returns:
-        list of dicts: Each dict contains:
+        max_workers: Threads processing files concurrently (default: CPU count + 4,
+            capped at 32). EXIF decoding and copying release the GIL, so files
+            overlap on I/O; results are still yielded in scan order.
+        use_processes: Use worker processes instead of threads (default: False),
+            for libraries where Python-level EXIF parsing, not I/O, is the
+            bottleneck. max_workers then defaults to the CPU count.
+
+    Yields:
+        dict: One per file, containing:
             - original_path: str
             - organized_path: str
             - filename: str
@@ -245,7 +558,7 @@ def rename_and_organize(
             - processed: bool (True if copied, False if skipped)
 
     Raises:
-        FileNotFoundError: If source_dir doesn't exist
+        FileNotFoundError: If source_dir doesn't exist (on first iteration)
         PermissionError: If dest_dir isn't writable
     """
     source = Path(source_dir)
@@ -254,114 +567,140 @@ def rename_and_organize(
     if not source.exists():
         raise FileNotFoundError(f"Source directory not found: {source_dir}")
 
-    # Supported formats
-    image_patterns = [
-        "*.heic",
-        "*.HEIC",
-        "*.jpg",
-        "*.JPG",
-        "*.jpeg",
-        "*.JPEG",
-        "*.png",
-        "*.PNG",
-        "*.webp",
-        "*.WEBP",
-    ]
-
-    video_patterns = [
-        "*.mov",
-        "*.MOV",
-        "*.mp4",
-        "*.MP4",
-        "*.avi",
-        "*.AVI",
-        "*.mkv",
-        "*.MKV",
-    ]
-
-    # Store results
-    results = []
+    # Destination directories already created this run (a handful of year
+    # directories shared by thousands of files - only mkdir each once)
+    created_dirs = set()
 
     # Get file iterator based on recursive flag
-    if recursive:
-        # Recursively find all files
-        file_iterator = source.rglob("*")
+    file_iterator = _iter_source_files(source, recursive)
+
+    # Keep a bounded window of files in flight so memory stays flat however
+    # large the import is, yielding results in scan order as they complete
+    if use_processes:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_process_worker,
+            initargs=(dest, preserve_filenames, photo_details),
+        )
+        task, task_args = _organize_one_in_process, ()
     else:
-        # Only immediate directory
-        file_iterator = source.iterdir()
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        task = _organize_one
+        task_args = (dest, preserve_filenames, photo_details, created_dirs)
+    window = max_workers * 4
+    pending = deque()
+
+    with executor:
+        try:
+            for file_path in file_iterator:
+                pending.append(executor.submit(task, file_path, *task_args))
+                if len(pending) >= window:
+                    yield _place(pending.popleft())
+
+            while pending:
+                yield _place(pending.popleft())
+        finally:
+            # Stopped early (error, or the caller closed the generator) -
+            # leave no staged copies behind
+            _discard(pending)
+
+
+def _reflink(fsrc, fdst) -> bool:
+    """Clone fsrc onto fdst copy-on-write. False if unsupported here."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        # Different filesystems, or no reflink support (ext4, tmpfs, ...)
+        return False
+    return True
+
+
+def _copy_file_range(fsrc, fdst) -> bool:
+    """Copy fsrc to fdst inside the kernel. False if unsupported here.
+
+    Both file offsets advance together, so on failure the caller can resume
+    from the current position.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    try:
+        while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+            pass
+    except OSError:
+        return False
+    return True
+
+
+def _copy_buffered(fsrc, fdst) -> None:
+    """Copy the rest of fsrc to fdst through a reused 1 MiB buffer."""
+    buffer = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buffer)
+    while n := fsrc.readinto(buffer):
+        written = 0
+        while written < n:
+            written += fdst.write(view[written:n])
+
+
+def _fastcopy(src, dst) -> None:
+    """Copy src to dst with its timestamps, permission bits and xattrs.
+
+    Tries a copy-on-write reflink first (instant on btrfs/XFS), then a
+    kernel-side os.copy_file_range (no userspace copies, server-side on NFS),
+    then a plain 1 MiB buffered loop.
+
+    Where os.listxattr exists (Linux), extended attributes are copied over the
+    open descriptors and atime/mtime and mode come from the same fstat,
+    skipping copystat's second stat. Elsewhere shutil.copystat is used.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        if not _reflink(fsrc, fdst) and not _copy_file_range(fsrc, fdst):
+            _copy_buffered(fsrc, fdst)
+        if hasattr(os, "listxattr"):
+            _copy_xattrs(fsrc.fileno(), fdst.fileno())
+            st = os.fstat(fsrc.fileno())
+        else:
+            st = None
+    if st is None:
+        shutil.copystat(src, dst)
+        return
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
 
-    # Process all files
-    for file_path in file_iterator:
-        if not file_path.is_file():
-            continue
 
-        suffix = file_path.suffix.lower()
+def _copy_xattrs(src_fd: int, dst_fd: int) -> None:
+    """Copy extended attributes between open files, skipping any refused.
 
-        # Check if supported media type
-        is_image = any(file_path.match(pattern) for pattern in image_patterns)
-        is_video = any(file_path.match(pattern) for pattern in video_patterns)
+    Like shutil.copy2, attributes the destination filesystem doesn't support
+    or the process may not set (e.g. security.*) are silently left behind.
+    """
+    try:
+        names = os.listxattr(src_fd)
+    except OSError:
+        return  # Source filesystem has no xattr support
+    for name in names:
+        try:
+            os.setxattr(dst_fd, name, os.getxattr(src_fd, name))
+        except OSError:
+            pass
 
-        if is_image or is_video:
-            # Determine media type
-            media_type = "image" if is_image else "video"
-            # Extract metadata (with optional Photo Details for improved dates)
-            date, source_type = extract_exif_date(file_path, photo_details)
-            camera = extract_camera_info(file_path)
-
-            # Generate organized path
-            rel_path = generate_organized_path(
-                date, source_type, file_path.name, preserve_filenames, media_type
-            )
-            new_path = dest / rel_path
-
-            # Create directory if needed
-            new_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file (don't delete original yet - safety)
-            shutil.copy2(file_path, new_path)
-
-            # Store result
-            results.append(
-                {
-                    "original_path": str(file_path),
-                    "organized_path": str(new_path),
-                    "filename": new_path.name,
-                    "date_taken": date,
-                    "date_source": source_type,
-                    "camera_make": camera["make"],
-                    "camera_model": camera["model"],
-                    "file_type": media_type,  # 'image' or 'video'
-                    "processed": True,
-                }
-            )
 
-        else:
-            # Track non-image files for orchestration reporting
-            if suffix in {".mp4", ".mov", ".avi", ".mkv"}:
-                file_type = "video"
-            elif suffix in {".csv", ".txt", ".json"}:
-                file_type = "metadata"
-            else:
-                file_type = "other"
-
-            results.append(
-                {
-                    "original_path": str(file_path),
-                    "organized_path": None,
-                    "filename": file_path.name,
-                    "date_taken": None,
-                    "date_source": None,
-                    "camera_make": None,
-                    "camera_model": None,
-                    "file_type": file_type,
-                    "processed": False,
-                }
-            )
-
-    return results
-
-
-def unzip_archive(zip_path, extract_to=None):
+def _member_target(extract_to: Path, name: str) -> Path:
+    """Destination of a zip member, sanitized like ZipFile.extract() does.
+
+    Drops empty, '.' and '..' components so members can't escape extract_to.
+    """
+    parts = [p for p in name.split("/") if p not in ("", ".", "..")]
+    return extract_to.joinpath(*parts)
+
+
+def unzip_archive(zip_path, extract_to=None, max_workers=None, filter_photos=False):
     """Extract media from zip archive (iCloud exports, photo backups, etc.).
 
     Common use cases:
@@ -372,6 +711,10 @@ def unzip_archive(zip_path, extract_to=None):
     Args:
         zip_path: Path to zip file
         extract_to: Destination directory (default: same dir as zip with '_extracted' suffix)
+        max_workers: Threads used to decompress members in parallel
+            (default: ThreadPoolExecutor's default, based on CPU count)
+        filter_photos: Only extract media and metadata (Photo Details CSVs)
+            members, skipping sidecars and macOS resource forks (default: False)
 
     Returns:
         Path: Directory where files were extracted
@@ -390,8 +733,13 @@ def unzip_archive(zip_path, extract_to=None):
     if not zip_path.exists():
         raise FileNotFoundError(f"Zip file not found: {zip_path}")
 
-    if not zipfile.is_zipfile(zip_path):
-        raise zipfile.BadZipFile(f"Not a valid zip file: {zip_path}")
+    # Opening parses the central directory, which also validates the archive
+    # (no separate is_zipfile() pass over the file)
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            members = zip_ref.infolist()
+    except zipfile.BadZipFile as e:
+        raise zipfile.BadZipFile(f"Not a valid zip file: {zip_path}") from e
 
     # Default extraction directory: same name as zip without extension
     if extract_to is None:
@@ -402,8 +750,53 @@ def unzip_archive(zip_path, extract_to=None):
     # Create extraction directory
     extract_to.mkdir(parents=True, exist_ok=True)
 
-    # Extract all files
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(extract_to)
+    # Resolve each member's destination, building the directory tree up
+    # front so workers never race on mkdir
+    wanted_suffixes = _IMAGE_SUFFIXES | _VIDEO_SUFFIXES | _METADATA_SUFFIXES
+    to_extract = []
+    created_dirs = {extract_to}
+    for member in members:
+        target = _member_target(extract_to, member.filename)
+        if member.is_dir():
+            if target not in created_dirs:
+                target.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target)
+            continue
+        if target == extract_to:
+            continue  # Name sanitized away entirely (e.g. '..')
+        if filter_photos and (
+            target.suffix.lower() not in wanted_suffixes
+            # macOS AppleDouble resource forks ('__MACOSX/._IMG_0001.HEIC')
+            or target.name.startswith("._")
+        ):
+            continue
+        # Exports put thousands of members in a few folders - mkdir each once
+        if target.parent not in created_dirs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(target.parent)
+        to_extract.append((member, target))
+
+    # Extract members in parallel (zlib releases the GIL while inflating).
+    # ZipFile handles aren't safe to share across threads - one per worker.
+    local = threading.local()
+    handles = []
+
+    def extract(member_and_target):
+        member, target = member_and_target
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            handles.append(zip_ref)
+        # Stream through a 1 MiB buffer (zipfile's own extract uses 8 KiB)
+        with zip_ref.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() surfaces any worker exception
+            list(executor.map(extract, to_extract))
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
 
     return extract_to
@@ -19,9 +19,31 @@ Integration:
 """
 
 import csv
+import re
 from datetime import datetime
 from pathlib import Path
 
+# iCloud date format: "Friday July 4,2025 3:46 AM GMT" (day name and timezone
+# ignored; AM/PM optional for 24-hour exports)
+_ICLOUD_DATE_RE = re.compile(
+    r"^\S+\s+([A-Za-z]+)\s+(\d{1,2}),(\d{4})\s+(\d{1,2}):(\d{2})"
+    r"(?:\s+([AaPp][Mm]))?\s+\S+$"
+)
+_MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
 
 def parse_icloud_date(date_string: str) -> datetime | None:
     """Parse iCloud date format from Photo Details CSV.
@@ -43,6 +65,25 @@ def parse_icloud_date(date_string: str) -> datetime | None:
     if not date_string:
         return None
 
+    # Fast path: one regex match and a direct datetime() - strptime
+    # re-interprets its format string on every call
+    match = _ICLOUD_DATE_RE.match(date_string.strip())
+    if match:
+        month_name, day, year, hour, minute, meridiem = match.groups()
+        month = _MONTHS.get(month_name.lower())
+        hour = int(hour)
+        if month is None:
+            return None
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            # 12 AM is midnight, 12 PM is noon
+            hour = hour % 12 + (12 if meridiem.upper() == "PM" else 0)
+        try:
+            return datetime(int(year), month, int(day), hour, int(minute))
+        except ValueError:
+            return None
+
     try:
         # iCloud format: "Friday July 4,2025 3:46 AM GMT"
         # Remove day name (first word) and timezone (last word)
@@ -67,6 +108,25 @@ def parse_icloud_date(date_string: str) -> datetime | None:
         return None
 
 
+def _column_index(header: list[str], name: str) -> int | None:
+    """Position of a column in a CSV header, or None if it's absent.
+
+    Absent columns must not map to any position: rows longer than their
+    header would otherwise supply a stray trailing field as the value.
+    """
+    try:
+        return header.index(name)
+    except ValueError:
+        return None
+
+
+def _field(row: list[str], idx: int | None, n_fields: int) -> str | None:
+    """Value at a _column_index() position, None if absent or truncated."""
+    if idx is None or idx >= n_fields:
+        return None
+    return row[idx]
+
+
 def load_photo_details(csv_path: Path) -> dict[str, dict]:
     """Load Photo Details CSV into filename lookup dict.
 
@@ -94,17 +154,39 @@ def load_photo_details(csv_path: Path) -> dict[str, dict]:
 
     try:
         with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader with column positions resolved once from the
+            # header - DictReader builds (and hashes) a dict for every row
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header or "filename" not in header:
+                return {}
+
+            filename_idx = header.index("filename")
+            date_idx = _column_index(header, "originalCreationDate")
+            checksum_idx = _column_index(header, "fileChecksum")
+
+            # Burst shots and screenshots repeat the same minute-resolution
+            # date string, so each distinct string is parsed only once
+            parsed_dates = {}
 
             for row in reader:
-                filename = row.get("filename")
-                date_str = row.get("originalCreationDate")
-                checksum = row.get("fileChecksum")
+                n_fields = len(row)
+                if filename_idx >= n_fields:
+                    continue  # Blank or truncated row
+
+                filename = row[filename_idx]
+                date_str = _field(row, date_idx, n_fields)
+                checksum = _field(row, checksum_idx, n_fields)
 
                 if not filename:
                     continue
 
-                parsed_date = parse_icloud_date(date_str) if date_str else None
+                if date_str in parsed_dates:
+                    parsed_date = parsed_dates[date_str]
+                else:
+                    parsed_date = parsed_dates[date_str] = (
+                        parse_icloud_date(date_str) if date_str else None
+                    )
 
                 details[filename] = {
                     "date": parsed_date,
@@ -118,6 +200,63 @@ def load_photo_details(csv_path: Path) -> dict[str, dict]:
     return details
 
 
+def _read_header(csv_path: Path) -> list[str] | None:
+    """Header row of a CSV, or None if it's missing, empty or unreadable."""
+    try:
+        with open(csv_path, encoding="utf-8") as f:
+            return next(csv.reader(f), None) or None
+    except Exception:
+        return None
+
+
+def _conformer(header: list[str], fieldnames: list[str]):
+    """Build a function mapping rows under header onto fieldnames.
+
+    Parts with a different column order are remapped by name (missing columns
+    left blank, extra ones dropped), and ragged rows are padded/truncated to
+    the header width.
+    """
+    width = len(fieldnames)
+
+    if header == fieldnames:
+
+        def conform(row):
+            return row if len(row) == width else (row + [""] * width)[:width]
+
+    else:
+        remap = [_column_index(header, name) for name in fieldnames]
+
+        def conform(row):
+            n_fields = len(row)
+            return [_field(row, i, n_fields) or "" for i in remap]
+
+    return conform
+
+
+def _iter_named_rows(csv_path: Path, fieldnames: list[str]):
+    """Yield (filename, row, conform) for each row of a Photo Details CSV.
+
+    conform maps the row onto fieldnames (see _conformer()). Rows without a
+    filename are skipped. Yields nothing for missing files or CSVs without a
+    'filename' column, and stops early on malformed CSVs.
+    """
+    try:
+        with open(csv_path, encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header or "filename" not in header:
+                return
+
+            filename_idx = header.index("filename")
+            conform = _conformer(header, fieldnames)
+            for row in reader:
+                if filename_idx < len(row) and row[filename_idx]:
+                    yield row[filename_idx], row, conform
+    except Exception:
+        # Skip (the rest of) malformed or missing CSVs
+        return
+
+
 def consolidate_csvs(csv_paths: list[Path], output_path: Path) -> Path:
     """Consolidate multiple Photo Details CSVs from multi-part iCloud exports.
 
@@ -125,6 +264,12 @@ def consolidate_csvs(csv_paths: list[Path], output_path: Path) -> Path:
     a "Photo Details.csv" file. This function merges them into a single CSV,
     deduplicating entries by filename (last occurrence wins).
 
+    Rows keep the order in which each filename first appears, carrying the
+    values of its last occurrence. One read records each filename's first
+    position and keeps rows only for filenames that repeat; a second read
+    writes rows out at their first positions. Memory holds a position per
+    filename plus the repeated filenames' rows, rather than every row.
+
     Args:
         csv_paths: List of Photo Details CSV file paths
         output_path: Where to write the consolidated CSV
@@ -148,42 +293,47 @@ def consolidate_csvs(csv_paths: list[Path], output_path: Path) -> Path:
     if not output_path:
         raise ValueError("output_path must be specified")
 
-    # Use dict to deduplicate by filename (last occurrence wins)
-    all_rows = {}
+    # Record each filename's first position, keeping the latest row only for
+    # filenames that repeat (last occurrence wins)
+    first_positions = {}  # filename -> (part, row)
+    repeated_rows = {}  # filename -> conformed row
     fieldnames = None
 
-    for csv_path in csv_paths:
-        if not csv_path.exists():
-            continue
-
-        try:
-            with open(csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                # Capture fieldnames from first valid CSV
-                if fieldnames is None and reader.fieldnames:
-                    fieldnames = reader.fieldnames
-
-                for row in reader:
-                    filename = row.get("filename")
-                    if filename:
-                        all_rows[filename] = row  # Deduplicate by filename
+    for part_idx, csv_path in enumerate(csv_paths):
+        # Capture fieldnames from first valid CSV
+        if fieldnames is None:
+            fieldnames = _read_header(csv_path)
+            if fieldnames is None:
+                continue
 
-        except Exception:
-            # Skip malformed CSVs
-            continue
+        rows = _iter_named_rows(csv_path, fieldnames)
+        for row_idx, (filename, row, conform) in enumerate(rows):
+            if filename in first_positions:
+                repeated_rows[filename] = conform(row)
+            else:
+                first_positions[filename] = (part_idx, row_idx)
 
     # Write consolidated CSV
-    if not all_rows or not fieldnames:
+    if not first_positions:
         # Create empty file if no valid data
         output_path.touch()
         return output_path
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def first_seen_rows(part_idx, csv_path):
+        rows = _iter_named_rows(csv_path, fieldnames)
+        for row_idx, (filename, row, conform) in enumerate(rows):
+            if first_positions.get(filename) == (part_idx, row_idx):
+                final = repeated_rows.get(filename)
+                yield conform(row) if final is None else final
+
+    # Stream rows out in first-seen order (writerows drives the generator
+    # from C rather than a writerow() call per row)
     with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_rows.values())
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for part_idx, csv_path in enumerate(csv_paths):
+            writer.writerows(first_seen_rows(part_idx, csv_path))
 
     return output_path
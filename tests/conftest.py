@@ -12,91 +12,145 @@ Author: Leonardo
 Version: v0.1.0
 """
 
-import shutil
+import os
 import sqlite3
-import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Mapping
 from datetime import datetime
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
 # Import modules to test
+from src.config import get_default_config_path, get_default_paths
 from src.database import create_database
+from src.exif_extractor import (
+    extract_camera_info,
+    extract_exif_date,
+    extract_gps_coords,
+)
+from src.organize import rename_and_organize
+
+# conftest.py is in /tests, so parent is project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_SAMPLE_PHOTOS_DIR = _PROJECT_ROOT / "data" / "sample_photos"
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_caches() -> Generator[None, None, None]:
+    """Reset src.config's cached default paths around every test.
+
+    get_default_paths() and get_default_config_path() are cached for the
+    process lifetime, so without this a test that patches HOME/XDG_* would
+    silently see whichever paths the first caller cached.
+    """
+    get_default_paths.cache_clear()
+    get_default_config_path.cache_clear()
+    yield
+    get_default_paths.cache_clear()
+    get_default_config_path.cache_clear()
 
 
 @pytest.fixture
-def temp_db() -> Generator[Path, None, None]:
-    """Create a temporary SQLite database for testing.
+def temp_db(tmp_path: Path) -> Path:
+    """Create a temporary SQLite database path for testing.
 
-    Yields:
-        Path: Path to temporary database file
+    Returns:
+        Path: Path to a not-yet-created database file in pytest's tmp_path
 
     Cleanup:
-        Automatically removes database after test completes
+        Handled by pytest's tmp_path retention policy (no file is created
+        until SQLite opens it)
 
     Example:
         def test_database_operations(temp_db):
             conn = sqlite3.connect(temp_db)
             # ... perform tests ...
     """
-    # Create temp database file
-    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-    db_path = Path(db_file.name)
-    db_file.close()
+    return tmp_path / "test.db"
+
 
-    yield db_path
+@pytest.fixture(scope="session")
+def _schema_blob() -> bytes:
+    """Build the images/locations schema once per session, serialized.
 
-    # Cleanup after test
-    if db_path.exists():
-        db_path.unlink()
+    Returns:
+        bytes: In-memory database image with tables and indexes, no rows
+    """
+    conn = create_database(":memory:")
+    blob = conn.serialize()
+    conn.close()
+    return blob
 
 
 @pytest.fixture
-def temp_db_with_schema(temp_db: Path) -> Generator[sqlite3.Connection, None, None]:
-    """Create a temporary database with schema initialized.
+def temp_db_with_schema(
+    _schema_blob: bytes,
+) -> Generator[sqlite3.Connection, None, None]:
+    """Create an in-memory database with schema initialized.
+
+    Deserializes the session's schema blob rather than re-running the DDL
+    for every test; nothing touches the filesystem. Tests that need a
+    database file on disk should use temp_db with create_database instead.
 
     Yields:
         sqlite3.Connection: Connected database with images/locations tables
 
     Cleanup:
-        Automatically closes connection and removes database
+        Automatically closes connection (memory is freed on close)
 
     Example:
         def test_insert_image(temp_db_with_schema):
             conn = temp_db_with_schema
             # Tables already exist, ready to insert data
     """
-    conn = create_database(temp_db)
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(_schema_blob)
+    conn.row_factory = sqlite3.Row  # As create_database() sets it
     yield conn
     conn.close()
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for file operations.
 
-    Yields:
-        Path: Path to temporary directory
+    Returns:
+        Path: Path to temporary directory (pytest's per-test tmp_path)
 
     Cleanup:
-        Automatically removes directory and all contents
+        Handled by pytest's tmp_path retention policy
 
     Example:
         def test_file_organization(temp_dir):
             output_dir = temp_dir / "organized"
             # ... test file operations ...
     """
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
+    return tmp_path
 
-    # Cleanup
-    if temp_path.exists():
-        shutil.rmtree(temp_path)
 
+@cache
+def _sample_files(samples_dir: Path) -> dict[str, list[Path]]:
+    """Group sample files by lowercased suffix from a single directory scan.
 
-@pytest.fixture
+    Shared by the sample_* fixtures so HEIC/JPEG/PNG lookups don't each
+    re-glob the directory once per case variant. Uses os.scandir so the
+    suffix is read off the raw entry name; only matches become Paths.
+    """
+    by_suffix: dict[str, list[str]] = {}
+    with os.scandir(samples_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                suffix = os.path.splitext(entry.name)[1].lower()
+                by_suffix.setdefault(suffix, []).append(entry.path)
+    return {
+        suffix: [Path(p) for p in sorted(paths)] for suffix, paths in by_suffix.items()
+    }
+
+
+@pytest.fixture(scope="session")
 def sample_photos_dir() -> Path:
     """Get path to sample photos directory.
 
@@ -113,15 +167,99 @@ def sample_photos_dir() -> Path:
         - PNG files (likely no EXIF)
         - Mix of GPS-enabled and non-GPS images
     """
-    samples_dir = Path("data/sample_photos")
+    if not os.path.isdir(_SAMPLE_PHOTOS_DIR):
+        pytest.skip(f"Sample photos directory not found: {_SAMPLE_PHOTOS_DIR}")
 
-    if not samples_dir.exists():
-        pytest.skip(f"Sample photos directory not found: {samples_dir}")
+    return _SAMPLE_PHOTOS_DIR
 
-    return samples_dir
 
+@pytest.fixture(scope="session")
+def sample_files(sample_photos_dir: Path) -> dict[str, list[Path]]:
+    """Get sample files grouped by lowercased suffix (e.g. ".heic").
 
-@pytest.fixture
+    Returns:
+        Dict: Suffix -> sorted sample file paths, from one directory scan
+
+    Example:
+        def test_all_jpegs(sample_files):
+            jpegs = sample_files.get(".jpg", []) + sample_files.get(".jpeg", [])
+    """
+    return _sample_files(sample_photos_dir)
+
+
+@pytest.fixture(scope="session")
+def sample_files_with_suffixes(
+    sample_files: dict[str, list[Path]],
+) -> Callable[..., list[Path]]:
+    """Get a lookup collecting sample files for one or more suffixes.
+
+    Returns:
+        Callable: (*suffixes) -> sample file paths, grouped in suffix order
+
+    Example:
+        def test_all_jpegs(sample_files_with_suffixes):
+            jpegs = sample_files_with_suffixes(".jpeg", ".jpg")
+    """
+
+    def files_with_suffixes(*suffixes: str) -> list[Path]:
+        return [path for suffix in suffixes for path in sample_files.get(suffix, [])]
+
+    return files_with_suffixes
+
+
+@pytest.fixture(scope="session")
+def sample_exif(sample_files: dict[str, list[Path]]) -> dict[Path, tuple]:
+    """Extract date and camera info from every sample image, once per session.
+
+    Returns:
+        Dict: Image path -> (extract_exif_date(), extract_camera_info()),
+        for HEIC/JPEG/PNG samples in directory order
+
+    Note:
+        EXIF decoding dominates the integration tests; sharing the results
+        means each image is parsed once rather than once per test.
+    """
+    return {
+        path: (extract_exif_date(str(path)), extract_camera_info(str(path)))
+        for suffix in (".heic", ".jpeg", ".jpg", ".png")
+        for path in sample_files.get(suffix, [])
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_gps(sample_files: dict[str, list[Path]]) -> dict[Path, tuple | None]:
+    """Extract GPS coordinates from every sample image, once per session.
+
+    Returns:
+        Dict: Image path -> extract_gps_coords() result ((lat, lon, alt) or
+        None), for HEIC/JPEG/PNG samples in directory order
+    """
+    return {
+        path: extract_gps_coords(str(path))
+        for suffix in (".heic", ".jpeg", ".jpg", ".png")
+        for path in sample_files.get(suffix, [])
+    }
+
+
+@pytest.fixture(scope="session")
+def organized_samples(
+    sample_photos_dir: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, list[dict[str, Any]]]:
+    """Organize the sample photos once per session.
+
+    Returns:
+        Tuple: (output directory, list of rename_and_organize() result dicts)
+
+    Note:
+        Consumers must treat the output tree as read-only; it's shared by
+        every test in the session.
+    """
+    output_dir = tmp_path_factory.mktemp("organized")
+    results = list(rename_and_organize(str(sample_photos_dir), str(output_dir)))
+    return output_dir, results
+
+
+@pytest.fixture(scope="session")
 def sample_heic_with_gps(sample_photos_dir: Path) -> Path:
     """Get a sample HEIC file known to have GPS data.
 
@@ -131,9 +269,7 @@ def sample_heic_with_gps(sample_photos_dir: Path) -> Path:
     Note:
         Modify this if your sample photos have different filenames
     """
-    heic_files = list(sample_photos_dir.glob("*.HEIC")) + list(
-        sample_photos_dir.glob("*.heic")
-    )
+    heic_files = _sample_files(sample_photos_dir).get(".heic", [])
 
     if not heic_files:
         pytest.skip("No HEIC files found in sample photos")
@@ -142,19 +278,15 @@ def sample_heic_with_gps(sample_photos_dir: Path) -> Path:
     return heic_files[0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jpeg(sample_photos_dir: Path) -> Path:
     """Get a sample JPEG file.
 
     Returns:
         Path: Path to JPEG file
     """
-    jpeg_files = (
-        list(sample_photos_dir.glob("*.JPEG"))
-        + list(sample_photos_dir.glob("*.jpeg"))
-        + list(sample_photos_dir.glob("*.JPG"))
-        + list(sample_photos_dir.glob("*.jpg"))
-    )
+    by_suffix = _sample_files(sample_photos_dir)
+    jpeg_files = by_suffix.get(".jpeg", []) + by_suffix.get(".jpg", [])
 
     if not jpeg_files:
         pytest.skip("No JPEG files found in sample photos")
@@ -162,16 +294,14 @@ def sample_jpeg(sample_photos_dir: Path) -> Path:
     return jpeg_files[0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_png(sample_photos_dir: Path) -> Path:
     """Get a sample PNG file.
 
     Returns:
         Path: Path to PNG file
     """
-    png_files = list(sample_photos_dir.glob("*.PNG")) + list(
-        sample_photos_dir.glob("*.png")
-    )
+    png_files = _sample_files(sample_photos_dir).get(".png", [])
 
     if not png_files:
         pytest.skip("No PNG files found in sample photos")
@@ -215,12 +345,27 @@ def mock_config(temp_dir: Path, temp_db: Path) -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_image_data() -> dict[str, Any]:
-    """Create sample image metadata for database testing.
+# Read-only so the session-scoped fixture can't leak mutations between tests
+_SAMPLE_IMAGE_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "original_path": "/test/photos/IMG_1234.HEIC",
+        "organized_path": "/test/organized/2025/2025-05-22_143022.heic",
+        "filename": "2025-05-22_143022.heic",
+        "date_taken": datetime(2025, 5, 22, 14, 30, 22),  # datetime object, not string
+        "date_source": "exif",
+        "camera_make": "Apple",
+        "camera_model": "iPhone 14 Pro",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_image_data() -> Mapping[str, Any]:
+    """Sample image metadata for database testing.
 
     Returns:
-        Dict: Image metadata dictionary matching database schema
+        Mapping: Read-only image metadata matching database schema; use
+        dict(sample_image_data) for a mutable copy
 
     Example:
         def test_insert_image(temp_db_with_schema, sample_image_data):
@@ -228,15 +373,7 @@ def sample_image_data() -> dict[str, Any]:
             image_id = insert_image(conn, sample_image_data)
             assert image_id > 0
     """
-    return {
-        "original_path": "/test/photos/IMG_1234.HEIC",
-        "organized_path": "/test/organized/2025/2025-05-22_143022.heic",
-        "filename": "2025-05-22_143022.heic",
-        "date_taken": datetime(2025, 5, 22, 14, 30, 22),  # datetime object, not string
-        "date_source": "exif",
-        "camera_make": "Apple",
-        "camera_model": "iPhone 14 Pro",
-    }
+    return _SAMPLE_IMAGE_DATA
 
 
 @pytest.fixture(scope="session")
@@ -249,8 +386,7 @@ def project_root() -> Path:
     Note:
         Scope="session" means this is created once per test session
     """
-    # conftest.py is in /tests, so parent is project root
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
 
 
 # Pytest configuration
@@ -12,11 +12,18 @@ Author: Leonardo
 Version: v0.1.0
 """
 
+import io
+import sys
 from pathlib import Path
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 from src.config import get_default_config_path, get_default_paths, get_path, load_config
 
 
@@ -39,6 +46,34 @@ class TestDefaultPaths:
         for key, value in defaults.items():
             assert isinstance(value, Path), f"{key} should be a Path object"
 
+    def test_default_paths_cached_and_read_only(self):
+        """Cached defaults are shared, so callers must not be able to mutate them."""
+        defaults = get_default_paths()
+
+        assert get_default_paths() is defaults
+        with pytest.raises(TypeError):
+            defaults["database"] = Path("/tmp/elsewhere.db")
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows ignores HOME")
+    def test_default_paths_follow_home_after_cache_clear(self, temp_dir, monkeypatch):
+        """A changed home directory takes effect once the caches are cleared."""
+        stale_paths = get_default_paths()
+        stale_config = get_default_config_path()
+
+        monkeypatch.setenv("HOME", str(temp_dir))
+        for var in ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_CACHE_HOME"):
+            monkeypatch.delenv(var, raising=False)
+
+        # Still cached until cleared
+        assert get_default_paths() is stale_paths
+        assert get_default_config_path() is stale_config
+
+        get_default_paths.cache_clear()
+        get_default_config_path.cache_clear()
+
+        assert get_default_paths()["database"].is_relative_to(temp_dir)
+        assert get_default_config_path().is_relative_to(temp_dir)
+
     def test_default_config_path_exists(self):
         """Default config path should return valid Path object."""
         config_path = get_default_config_path()
@@ -84,7 +119,7 @@ class TestConfigLoading:
 
         config_file = temp_dir / "config.yaml"
         with open(config_file, "w") as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=SafeDumper)
 
         config = load_config()
 
@@ -103,7 +138,7 @@ class TestConfigLoading:
         test_data = {"paths": {"database": "/explicit/path/db.db"}}
 
         with open(custom_config, "w") as f:
-            yaml.dump(test_data, f)
+            yaml.dump(test_data, f, Dumper=SafeDumper)
 
         config = load_config(str(custom_config))
 
@@ -124,36 +159,24 @@ class TestConfigLoading:
         test_config = {"paths": {"database": "~/Photos/archive.db"}}
 
         with open(config_file, "w") as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=SafeDumper)
 
         config = load_config()
 
         assert config["paths"]["database"] == Path.home() / "Photos/archive.db"
         assert "~" not in str(config["paths"]["database"])
 
-    def test_malformed_yaml(self, temp_dir, monkeypatch):
+    def test_malformed_yaml(self):
         """Malformed YAML should raise YAMLError."""
-        monkeypatch.chdir(temp_dir)
-
-        config_file = temp_dir / "config.yaml"
-        with open(config_file, "w") as f:
-            f.write("invalid: yaml: syntax:\n  - broken")
-
         with pytest.raises(yaml.YAMLError):
-            load_config()
+            load_config(io.StringIO("invalid: yaml: syntax:\n  - broken"))
 
-    def test_partial_config_merges_with_defaults(self, temp_dir, monkeypatch):
+    def test_partial_config_merges_with_defaults(self):
         """Partial config should merge with defaults."""
-        monkeypatch.chdir(temp_dir)
-
         # Config with only database path
-        config_file = temp_dir / "config.yaml"
         partial_config = {"paths": {"database": "/custom/db.db"}}
 
-        with open(config_file, "w") as f:
-            yaml.dump(partial_config, f)
-
-        config = load_config()
+        config = load_config(io.StringIO(yaml.dump(partial_config, Dumper=SafeDumper)))
 
         # Custom database path
         assert config["paths"]["database"] == Path("/custom/db.db")
@@ -9,17 +9,24 @@ Tests cover:
 - LEFT JOIN queries for incremental processing
 - Date range queries
 - Camera-based queries
+- Query plans use the schema's indexes
 
 Author: Leonardo
 Version: v0.1.0
 """
 
+import sqlite3
 from datetime import datetime
 
+import pytest
+
 from src.database import (
     create_database,
     insert_image,
+    insert_images_many,
     insert_location,
+    insert_locations_many,
+    load_processed_paths,
     query_by_camera,
     query_by_date_range,
     query_images_without_gps,
@@ -100,6 +107,8 @@ class TestDatabaseCreation:
 
         expected_indexes = {
             "idx_date_taken",
+            "idx_date_source",
+            "idx_original_path",
             "idx_camera",
             "idx_image_location",
             "idx_coordinates",
@@ -131,6 +140,80 @@ class TestDatabaseCreation:
 
         conn2.close()
 
+    def test_create_database_enables_wal(self, temp_db):
+        """File-backed databases should use WAL with synchronous=NORMAL."""
+        conn = create_database(temp_db)
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+        conn.close()
+
+    def test_create_database_merges_preexisting_duplicates(self, temp_db):
+        """Archives with duplicate original_path rows still open.
+
+        Databases written before the unique index could record a file twice;
+        the first row is kept and GPS rows move onto it.
+        """
+        conn = sqlite3.connect(temp_db)
+        conn.executescript("""
+            CREATE TABLE images (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_path TEXT NOT NULL,
+                organized_path TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                date_taken DATETIME,
+                date_source TEXT,
+                camera_make TEXT,
+                camera_model TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE locations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                image_id INTEGER NOT NULL,
+                latitude REAL NOT NULL,
+                longitude REAL NOT NULL,
+                altitude REAL,
+                FOREIGN KEY (image_id) REFERENCES images(id)
+            );
+            INSERT INTO images (original_path, organized_path, filename)
+            VALUES ('/a.jpg', '/o/a.jpg', 'a.jpg'),
+                   ('/b.jpg', '/o/b.jpg', 'b.jpg'),
+                   ('/a.jpg', '/o/a.jpg', 'a.jpg'),
+                   ('/a.jpg', '/o/a.jpg', 'a.jpg');
+            INSERT INTO locations (image_id, latitude, longitude)
+            VALUES (3, -37.8, 144.9), (4, -37.8, 144.9);
+        """)
+        conn.close()
+
+        conn = create_database(temp_db)
+
+        rows = conn.execute(
+            "SELECT id, original_path FROM images ORDER BY id"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [(1, "/a.jpg"), (2, "/b.jpg")]
+        locations = conn.execute("SELECT image_id FROM locations").fetchall()
+        assert [row[0] for row in locations] == [1]
+
+        # The unique index is now in place: re-inserts are no-ops
+        assert (
+            insert_image(
+                conn,
+                {
+                    "original_path": "/a.jpg",
+                    "organized_path": "/o/a.jpg",
+                    "filename": "a.jpg",
+                    "date_taken": None,
+                    "date_source": None,
+                    "camera_make": None,
+                    "camera_model": None,
+                },
+            )
+            == 1
+        )
+
+        conn.close()
+
 
 class TestImageInsertion:
     """Test inserting image metadata."""
@@ -156,9 +239,9 @@ class TestImageInsertion:
         row = cursor.fetchone()
 
         assert row is not None
-        assert row[1] == sample_image_data["original_path"]  # original_path
-        assert row[2] == sample_image_data["organized_path"]  # organized_path
-        assert row[3] == sample_image_data["filename"]  # filename
+        assert row["original_path"] == sample_image_data["original_path"]
+        assert row["organized_path"] == sample_image_data["organized_path"]
+        assert row["filename"] == sample_image_data["filename"]
 
     def test_insert_multiple_images(self, temp_db_with_schema):
         """Multiple images can be inserted."""
@@ -194,6 +277,44 @@ class TestImageInsertion:
         cursor.execute("SELECT COUNT(*) FROM images")
         assert cursor.fetchone()[0] == 2
 
+    def test_insert_images_many(self, temp_db_with_schema):
+        """A batch of images is inserted in one call, in order."""
+        conn = temp_db_with_schema
+
+        images = (
+            {
+                "original_path": f"/test/IMG_{i:03d}.jpg",
+                "organized_path": f"/organized/2025/2025-01-{i:02d}_120000.jpg",
+                "filename": f"2025-01-{i:02d}_120000.jpg",
+                "date_taken": datetime(2025, 1, i, 12, 0, 0) if i % 2 else None,
+                "date_source": "exif" if i % 2 else None,
+                "camera_make": "Canon",
+                "camera_model": "EOS R5",
+            }
+            for i in range(1, 6)
+        )
+
+        assert insert_images_many(conn, images) == 5
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT original_path, date_taken FROM images ORDER BY id")
+        rows = cursor.fetchall()
+        assert [r[0] for r in rows] == [f"/test/IMG_{i:03d}.jpg" for i in range(1, 6)]
+        assert rows[0][1] == "2025-01-01 12:00:00"
+        assert rows[1][1] is None
+
+    def test_insert_images_many_is_atomic(self, temp_db_with_schema, sample_image_data):
+        """A failing row rolls back the whole batch."""
+        conn = temp_db_with_schema
+        bad = dict(sample_image_data, original_path=None)  # NOT NULL violation
+
+        with pytest.raises(sqlite3.IntegrityError):
+            insert_images_many(conn, [sample_image_data, bad])
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM images")
+        assert cursor.fetchone()[0] == 0
+
     def test_insert_image_with_none_date(self, temp_db_with_schema):
         """Inserting image without date should work."""
         conn = temp_db_with_schema
@@ -241,13 +362,26 @@ class TestIdempotency:
         insert_image(conn, image_data)
 
         # Check if already processed (this is what process_photos.py does)
-        cursor = conn.cursor()
-        cursor.execute("SELECT original_path FROM images")
-        already_processed = {row[0] for row in cursor.fetchall()}
+        already_processed = load_processed_paths(conn)
 
         # Should detect duplicate
         assert image_data["original_path"] in already_processed
 
+    def test_insert_duplicate_original_path_is_noop(
+        self, temp_db_with_schema, sample_image_data
+    ):
+        """Re-inserting a stored original_path keeps one row and its id."""
+        conn = temp_db_with_schema
+
+        first_id = insert_image(conn, sample_image_data)
+        second_id = insert_image(conn, sample_image_data)
+        assert insert_images_many(conn, [sample_image_data]) == 0
+
+        assert second_id == first_id
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM images")
+        assert cursor.fetchone()[0] == 1
+
 
 class TestLocationOperations:
     """Test GPS location storage and retrieval."""
@@ -270,10 +404,10 @@ class TestLocationOperations:
         cursor.execute("SELECT * FROM locations WHERE id = ?", (location_id,))
         row = cursor.fetchone()
 
-        assert row[1] == image_id  # image_id
-        assert row[2] == lat  # latitude
-        assert row[3] == lon  # longitude
-        assert row[4] == alt  # altitude
+        assert row["image_id"] == image_id
+        assert row["latitude"] == lat
+        assert row["longitude"] == lon
+        assert row["altitude"] == alt
 
     def test_insert_location_without_altitude(
         self, temp_db_with_schema, sample_image_data
@@ -290,6 +424,19 @@ class TestLocationOperations:
 
         assert alt is None
 
+    def test_insert_locations_many(self, temp_db_with_schema, sample_image_data):
+        """A generator of coordinate tuples is inserted in one call."""
+        conn = temp_db_with_schema
+
+        image_ids = [
+            insert_image(conn, dict(sample_image_data, original_path=f"/test/{i}.jpg"))
+            for i in range(3)
+        ]
+        rows = ((image_id, -37.8, 144.9, None) for image_id in image_ids)
+
+        assert insert_locations_many(conn, rows) == 3
+        assert query_images_without_gps(conn) == []
+
     def test_query_images_without_gps(self, temp_db_with_schema):
         """LEFT JOIN query should find images without GPS data."""
         conn = temp_db_with_schema
@@ -363,18 +510,22 @@ class TestQueryOperations:
         """Date range queries should return matching images."""
         conn = temp_db_with_schema
 
-        # Insert images with different dates
-        for day in range(1, 6):
-            image_data = {
-                "original_path": f"/test/day{day}.jpg",
-                "organized_path": f"/organized/day{day}.jpg",
-                "filename": f"day{day}.jpg",
-                "date_taken": datetime(2025, 1, day, 12, 0, 0),
-                "date_source": "exif",
-                "camera_make": None,
-                "camera_model": None,
-            }
-            insert_image(conn, image_data)
+        # Insert images with different dates (one batch transaction)
+        insert_images_many(
+            conn,
+            (
+                {
+                    "original_path": f"/test/day{day}.jpg",
+                    "organized_path": f"/organized/day{day}.jpg",
+                    "filename": f"day{day}.jpg",
+                    "date_taken": datetime(2025, 1, day, 12, 0, 0),
+                    "date_source": "exif",
+                    "camera_make": None,
+                    "camera_model": None,
+                }
+                for day in range(1, 6)
+            ),
+        )
 
         # Query range 2025-01-02 to 2025-01-04
         # Note: BETWEEN is inclusive, but string '2025-01-04' = midnight
@@ -385,6 +536,12 @@ class TestQueryOperations:
         # Should return 3 images (days 2, 3, 4)
         assert len(results) == 3
 
+        # Limit keeps the earliest matches
+        results = query_by_date_range(
+            conn, "2025-01-02", "2025-01-04 23:59:59", limit=2
+        )
+        assert [row["filename"] for row in results] == ["day2.jpg", "day3.jpg"]
+
     def test_query_by_camera_make_and_model(self, temp_db_with_schema):
         """Camera queries should filter by make and model."""
         conn = temp_db_with_schema
@@ -396,17 +553,21 @@ class TestQueryOperations:
             ("Canon", "EOS R5"),
         ]
 
-        for make, model in cameras:
-            image_data = {
-                "original_path": f"/test/{make}_{model}.jpg",
-                "organized_path": f"/organized/{make}_{model}.jpg",
-                "filename": f"{make}_{model}.jpg",
-                "date_taken": datetime(2025, 1, 1),
-                "date_source": "exif",
-                "camera_make": make,
-                "camera_model": model,
-            }
-            insert_image(conn, image_data)
+        insert_images_many(
+            conn,
+            (
+                {
+                    "original_path": f"/test/{make}_{model}.jpg",
+                    "organized_path": f"/organized/{make}_{model}.jpg",
+                    "filename": f"{make}_{model}.jpg",
+                    "date_taken": datetime(2025, 1, 1),
+                    "date_source": "exif",
+                    "camera_make": make,
+                    "camera_model": model,
+                }
+                for make, model in cameras
+            ),
+        )
 
         # Query for specific camera
         results = query_by_camera(conn, make="Apple", model="iPhone 14 Pro")
@@ -419,3 +580,45 @@ class TestQueryOperations:
         # Query all
         results = query_by_camera(conn)
         assert len(results) == 3
+
+
+def _query_plan(conn, query_func, *args):
+    """Run a query helper and return the EXPLAIN QUERY PLAN detail it produced.
+
+    Captures the SQL the helper actually executes (parameters expanded) via
+    the trace callback, so the plan check follows any future query edits.
+    """
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        query_func(conn, *args)
+    finally:
+        conn.set_trace_callback(None)
+
+    details = []
+    for sql in statements:
+        for row in conn.execute("EXPLAIN QUERY PLAN " + sql):
+            details.append(row[3])
+    return " | ".join(details)
+
+
+class TestQueryPlans:
+    """Guard against schema edits that demote indexed queries to full scans."""
+
+    @pytest.mark.parametrize(
+        "query_func, args, index",
+        [
+            (query_by_date_range, ("2025-01-01", "2025-02-01"), "idx_date_taken"),
+            (query_by_date_range, ("2025-01-01", "2025-02-01", 10), "idx_date_taken"),
+            (query_by_camera, ("Apple", "iPhone 14 Pro"), "idx_camera"),
+            (query_by_camera, ("Apple",), "idx_camera"),
+            (query_images_without_gps, (), "idx_image_location"),
+        ],
+    )
+    def test_query_uses_index(self, temp_db_with_schema, query_func, args, index):
+        """Each query helper should be answered through its intended index."""
+        plan = _query_plan(temp_db_with_schema, query_func, *args)
+
+        assert f"INDEX {index}" in plan, f"Plan lost {index}: {plan}"
+        # The index supplies ORDER BY, no sort step
+        assert "TEMP B-TREE" not in plan, f"Plan sorts results: {plan}"
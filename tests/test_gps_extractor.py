@@ -22,8 +22,16 @@ Testing Philosophy:
 Version: v0.1.0
 """
 
+from datetime import datetime
+from pathlib import Path
+
 import pytest
 
+from src.database import (
+    insert_images_many,
+    insert_locations_many,
+    query_images_without_gps,
+)
 from src.exif_extractor import extract_gps_coords
 
 
@@ -37,7 +45,7 @@ class TestGPSExtraction:
     """
 
     @pytest.mark.integration
-    def test_extract_gps_from_sample_images(self, sample_photos_dir):
+    def test_extract_gps_from_sample_images(self, sample_gps):
         """Extract GPS from all sample images, validate when present.
 
         This tests the REAL workflow:
@@ -48,23 +56,14 @@ class TestGPSExtraction:
         Some images may not have GPS (location services off, screenshots, etc.)
         This is EXPECTED behavior, not a failure.
         """
-        # Find all sample photos
-        photo_files = list(sample_photos_dir.glob("*.*"))
-        photo_files = [
-            f
-            for f in photo_files
-            if f.suffix.lower() in [".heic", ".jpeg", ".jpg", ".png"]
-        ]
-
-        assert len(photo_files) > 0, "Need at least one sample image"
+        assert len(sample_gps) > 0, "Need at least one sample image"
 
         gps_found = 0
         no_gps = 0
+        lines = []  # Per-image report, printed once at the end
 
-        for photo in photo_files:
-            # Use same pattern as production code (stage2_extract_gps.py)
-            coords = extract_gps_coords(str(photo))
-
+        # Coordinates come from extract_gps_coords(), as in stage2_extract_gps.py
+        for photo, coords in sample_gps.items():
             if coords:
                 lat, lon, alt = coords
                 gps_found += 1
@@ -79,32 +78,31 @@ class TestGPSExtraction:
                         f"Altitude should be numeric: {type(alt)}"
                     )
 
-                print(f"  ✅ {photo.name}: ({lat:.6f}, {lon:.6f}, {alt})")
+                lines.append(f"  ✅ {photo.name}: ({lat:.6f}, {lon:.6f}, {alt})")
             else:
                 # No GPS data - this is expected for some images
                 no_gps += 1
-                print(f"  ⏭️  {photo.name}: No GPS data")
+                lines.append(f"  ⏭️  {photo.name}: No GPS data")
 
         # Report statistics
-        total = len(photo_files)
+        total = len(sample_gps)
+        print("\n".join(lines))
         print(f"\nGPS extraction summary: {gps_found}/{total} images had GPS data")
 
         # We don't assert gps_found > 0 because it depends on which samples you have
         # The test passes as long as extraction doesn't crash
 
     @pytest.mark.integration
-    def test_extract_gps_from_heic(self, sample_photos_dir):
+    def test_extract_gps_from_heic(self, sample_files_with_suffixes, sample_gps):
         """HEIC files should extract GPS if present."""
-        heic_files = list(sample_photos_dir.glob("*.HEIC")) + list(
-            sample_photos_dir.glob("*.heic")
-        )
+        heic_files = sample_files_with_suffixes(".heic")
 
         if not heic_files:
             pytest.skip("No HEIC files in sample data")
 
         # Test at least one HEIC file
         for heic in heic_files[:3]:  # Test first 3 HEIC files
-            coords = extract_gps_coords(str(heic))
+            coords = sample_gps[heic]
 
             # Coords may be None (no GPS) or tuple (has GPS)
             # Both are valid - we're testing the extraction doesn't crash
@@ -115,21 +113,16 @@ class TestGPSExtraction:
                 assert isinstance(lon, (int, float))
 
     @pytest.mark.integration
-    def test_extract_gps_from_jpeg(self, sample_photos_dir):
+    def test_extract_gps_from_jpeg(self, sample_files_with_suffixes, sample_gps):
         """JPEG files should extract GPS if present."""
-        jpeg_files = (
-            list(sample_photos_dir.glob("*.JPEG"))
-            + list(sample_photos_dir.glob("*.jpeg"))
-            + list(sample_photos_dir.glob("*.JPG"))
-            + list(sample_photos_dir.glob("*.jpg"))
-        )
+        jpeg_files = sample_files_with_suffixes(".jpeg", ".jpg")
 
         if not jpeg_files:
             pytest.skip("No JPEG files in sample data")
 
         # Test at least one JPEG file
         for jpeg in jpeg_files[:3]:  # Test first 3 JPEG files
-            coords = extract_gps_coords(str(jpeg))
+            coords = sample_gps[jpeg]
 
             # Coords may be None (no GPS) or tuple (has GPS)
             if coords:
@@ -256,61 +249,54 @@ class TestIntegration:
     """Integration tests with real sample data and database."""
 
     @pytest.mark.integration
-    def test_full_gps_workflow(self, sample_photos_dir, temp_db_with_schema):
+    def test_full_gps_workflow(self, sample_gps, temp_db_with_schema):
         """Integration test: Extract GPS from samples and store in DB.
 
         This tests the COMPLETE workflow used in production:
         1. Extract GPS from real image files (extract_gps_coords)
-        2. Insert into database (insert_location)
+        2. Insert into database (insert_images_many, insert_locations_many)
         3. Validate database storage
 
         Matches the pattern in examples/stage2_extract_gps.py
         """
-        from src.database import insert_image, insert_location
-
         conn = temp_db_with_schema
 
-        # Find all sample photos
-        photo_files = list(sample_photos_dir.glob("*.*"))
-        photo_files = [
-            f
-            for f in photo_files
-            if f.suffix.lower() in [".heic", ".jpeg", ".jpg", ".png"]
-        ]
-
-        gps_count = 0
-
-        for photo in photo_files:
-            # Extract GPS using public API (same as production code)
-            coords = extract_gps_coords(str(photo))
-
-            if coords:
-                lat, lon, alt = coords
-
-                # Create minimal image record for testing
-                image_data = {
-                    "original_path": str(photo),
-                    "organized_path": str(photo),
-                    "filename": photo.name,
-                    "date_taken": None,
+        # GPS extracted once per session via the public API (sample_gps)
+        coords_by_path = {
+            str(photo): coords for photo, coords in sample_gps.items() if coords
+        }
+
+        # Create minimal image records, one transaction for the batch
+        insert_images_many(
+            conn,
+            (
+                {
+                    "original_path": path,
+                    "organized_path": path,
+                    "filename": Path(path).name,
+                    "date_taken": datetime.now(),
                     "date_source": "test",
                     "camera_make": None,
                     "camera_model": None,
                 }
+                for path in coords_by_path
+            ),
+        )
 
-                # Insert using production database functions
-                from datetime import datetime
-
-                image_data["date_taken"] = datetime.now()
-                image_id = insert_image(conn, image_data)
-                insert_location(conn, image_id, lat, lon, alt)
-
-                gps_count += 1
+        # Store locations the way stage 2 does: one executemany per batch
+        inserted = insert_locations_many(
+            conn,
+            [
+                (image_id, *coords_by_path[path])
+                for image_id, path in query_images_without_gps(conn)
+            ],
+        )
+        gps_count = len(coords_by_path)
 
         # Verify data was stored
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM locations")
         stored_count = cursor.fetchone()[0]
 
-        assert stored_count == gps_count, "All GPS data should be stored"
+        assert stored_count == inserted == gps_count, "All GPS data should be stored"
         assert gps_count >= 0, "Should have non-negative count"
@@ -23,6 +23,37 @@ from src.photo_details_parser import (
     parse_icloud_date,
 )
 
+_DETAILS_FIELDS = ["filename", "originalCreationDate", "fileChecksum"]
+
+
+def _write_details_csv(csv_path, rows):
+    """Write rows (dicts keyed by _DETAILS_FIELDS) as a Photo Details CSV."""
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=_DETAILS_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _dict_consolidate(csv_paths, output_path):
+    """Reference consolidation: the original buffer-everything DictReader merge."""
+    all_rows = {}
+    fieldnames = None
+    for csv_path in csv_paths:
+        if not csv_path.exists():
+            continue
+        with open(csv_path, encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if fieldnames is None and reader.fieldnames:
+                fieldnames = reader.fieldnames
+            for row in reader:
+                if row.get("filename"):
+                    all_rows[row["filename"]] = row
+
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(all_rows.values())
+
 
 class TestiCloudDateParsing:
     """Test iCloud date format parsing."""
@@ -55,6 +86,18 @@ class TestiCloudDateParsing:
 
         assert result == datetime(2024, 6, 15, 0, 0)
 
+    def test_parse_icloud_date_24_hour(self):
+        """Exports without AM/PM use a 24-hour clock."""
+        assert parse_icloud_date("Friday July 4,2025 15:46 GMT") == datetime(
+            2025, 7, 4, 15, 46
+        )
+
+    def test_parse_icloud_date_invalid_values(self):
+        """Well-formed strings with impossible values should return None."""
+        assert parse_icloud_date("Monday February 30,2025 3:46 AM GMT") is None
+        assert parse_icloud_date("Monday Smarch 3,2025 3:46 AM GMT") is None
+        assert parse_icloud_date("Monday March 3,2025 13:46 PM GMT") is None
+
     def test_parse_empty_string(self):
         """Empty string should return None."""
         assert parse_icloud_date("") is None
@@ -74,18 +117,16 @@ class TestPhotoDetailsLoading:
         csv_path = temp_dir / "photo_details.csv"
 
         # Create sample CSV
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv_path,
+            [
                 {
                     "filename": "IMG_1234.HEIC",
                     "originalCreationDate": "Friday July 4,2025 3:46 AM GMT",
                     "fileChecksum": "abc123",
                 }
-            )
+            ],
+        )
 
         # Load and validate
         details = load_photo_details(csv_path)
@@ -98,30 +139,26 @@ class TestPhotoDetailsLoading:
         """Load CSV with multiple photos."""
         csv_path = temp_dir / "photo_details.csv"
 
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerows(
-                [
-                    {
-                        "filename": "IMG_1001.HEIC",
-                        "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
-                        "fileChecksum": "hash1",
-                    },
-                    {
-                        "filename": "IMG_1002.HEIC",
-                        "originalCreationDate": "Tuesday January 2,2025 2:30 PM GMT",
-                        "fileChecksum": "hash2",
-                    },
-                    {
-                        "filename": "IMG_1003.HEIC",
-                        "originalCreationDate": "Wednesday January 3,2025 11:45 PM GMT",
-                        "fileChecksum": "hash3",
-                    },
-                ]
-            )
+        _write_details_csv(
+            csv_path,
+            [
+                {
+                    "filename": "IMG_1001.HEIC",
+                    "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
+                    "fileChecksum": "hash1",
+                },
+                {
+                    "filename": "IMG_1002.HEIC",
+                    "originalCreationDate": "Tuesday January 2,2025 2:30 PM GMT",
+                    "fileChecksum": "hash2",
+                },
+                {
+                    "filename": "IMG_1003.HEIC",
+                    "originalCreationDate": "Wednesday January 3,2025 11:45 PM GMT",
+                    "fileChecksum": "hash3",
+                },
+            ],
+        )
 
         details = load_photo_details(csv_path)
 
@@ -134,18 +171,16 @@ class TestPhotoDetailsLoading:
         """Handle rows with missing dates gracefully."""
         csv_path = temp_dir / "photo_details.csv"
 
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv_path,
+            [
                 {
                     "filename": "Screenshot_1234.png",
                     "originalCreationDate": "",  # Missing date
                     "fileChecksum": "xyz789",
                 }
-            )
+            ],
+        )
 
         details = load_photo_details(csv_path)
 
@@ -157,24 +192,78 @@ class TestPhotoDetailsLoading:
         """Handle malformed dates gracefully."""
         csv_path = temp_dir / "photo_details.csv"
 
-        with open(csv_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv_path,
+            [
                 {
                     "filename": "IMG_5678.HEIC",
                     "originalCreationDate": "invalid date format",
                     "fileChecksum": "def456",
                 }
-            )
+            ],
+        )
 
         details = load_photo_details(csv_path)
 
         assert "IMG_5678.HEIC" in details
         assert details["IMG_5678.HEIC"]["date"] is None
 
+    def test_load_photo_details_column_order_and_missing_columns(self, temp_dir):
+        """Columns are found by header name; absent ones read as None."""
+        csv_path = temp_dir / "photo_details.csv"
+        csv_path.write_text(
+            "originalCreationDate,filename\n"
+            '"Friday July 4,2025 3:46 AM GMT",IMG_1234.HEIC\n'
+            "\n"
+            '"Friday July 4,2025 3:47 AM GMT"\n'  # Truncated row, no filename
+        )
+
+        details = load_photo_details(csv_path)
+
+        assert details == {
+            "IMG_1234.HEIC": {"date": datetime(2025, 7, 4, 3, 46), "checksum": None}
+        }
+
+    def test_load_photo_details_parses_repeated_dates_once(self, temp_dir, monkeypatch):
+        """Rows sharing a date string reuse one parse (burst shots)."""
+        from src import photo_details_parser
+
+        calls = []
+
+        def counting_parse(date_string):
+            calls.append(date_string)
+            return parse_icloud_date(date_string)
+
+        monkeypatch.setattr(photo_details_parser, "parse_icloud_date", counting_parse)
+
+        csv_path = temp_dir / "photo_details.csv"
+        csv_path.write_text(
+            "filename,originalCreationDate\n"
+            'IMG_0001.HEIC,"Friday July 4,2025 3:46 AM GMT"\n'
+            'IMG_0002.HEIC,"Friday July 4,2025 3:46 AM GMT"\n'
+            'IMG_0003.HEIC,"Friday July 4,2025 3:47 AM GMT"\n'
+        )
+
+        details = load_photo_details(csv_path)
+
+        assert len(calls) == 2
+        assert details["IMG_0002.HEIC"]["date"] == datetime(2025, 7, 4, 3, 46)
+        assert details["IMG_0003.HEIC"]["date"] == datetime(2025, 7, 4, 3, 47)
+
+    def test_load_photo_details_missing_column_ignores_extra_fields(self, temp_dir):
+        """A column absent from the header stays None even in over-long rows."""
+        csv_path = temp_dir / "photo_details.csv"
+        csv_path.write_text(
+            "filename,originalCreationDate\n"
+            'IMG_1234.HEIC,"Friday July 4,2025 3:46 AM GMT",stray\n'
+        )
+
+        details = load_photo_details(csv_path)
+
+        assert details == {
+            "IMG_1234.HEIC": {"date": datetime(2025, 7, 4, 3, 46), "checksum": None}
+        }
+
     def test_load_nonexistent_file(self, temp_dir):
         """Non-existent file should return empty dict."""
         csv_path = temp_dir / "nonexistent.csv"
@@ -202,32 +291,28 @@ class TestCSVConsolidation:
         output = temp_dir / "consolidated.csv"
 
         # Create first CSV
-        with open(csv1, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv1,
+            [
                 {
                     "filename": "IMG_1001.HEIC",
                     "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
                     "fileChecksum": "hash1",
                 }
-            )
+            ],
+        )
 
         # Create second CSV
-        with open(csv2, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv2,
+            [
                 {
                     "filename": "IMG_2001.HEIC",
                     "originalCreationDate": "Tuesday January 2,2025 2:30 PM GMT",
                     "fileChecksum": "hash2",
                 }
-            )
+            ],
+        )
 
         # Consolidate
         result_path = consolidate_csvs([csv1, csv2], output)
@@ -248,32 +333,28 @@ class TestCSVConsolidation:
         output = temp_dir / "consolidated.csv"
 
         # First CSV with IMG_1001
-        with open(csv1, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv1,
+            [
                 {
                     "filename": "IMG_1001.HEIC",
                     "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
                     "fileChecksum": "old_hash",
                 }
-            )
+            ],
+        )
 
         # Second CSV with same IMG_1001 (newer data)
-        with open(csv2, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv2,
+            [
                 {
                     "filename": "IMG_1001.HEIC",
                     "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
                     "fileChecksum": "new_hash",  # Updated checksum
                 }
-            )
+            ],
+        )
 
         # Consolidate
         consolidate_csvs([csv1, csv2], output)
@@ -283,6 +364,132 @@ class TestCSVConsolidation:
         assert len(details) == 1
         assert details["IMG_1001.HEIC"]["checksum"] == "new_hash"
 
+    def test_consolidate_different_column_order(self, temp_dir):
+        """Parts with reordered columns are remapped onto the first header."""
+        csv1 = temp_dir / "part1.csv"
+        csv2 = temp_dir / "part2.csv"
+        output = temp_dir / "consolidated.csv"
+
+        csv1.write_text(
+            "filename,originalCreationDate,fileChecksum\n"
+            'IMG_1001.HEIC,"Monday January 1,2025 10:00 AM GMT",hash1\n'
+        )
+        csv2.write_text("fileChecksum,filename\nhash2,IMG_2001.HEIC\n")
+
+        consolidate_csvs([csv1, csv2], output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["filename", "originalCreationDate", "fileChecksum"],
+            ["IMG_1001.HEIC", "Monday January 1,2025 10:00 AM GMT", "hash1"],
+            ["IMG_2001.HEIC", "", "hash2"],
+        ]
+
+    def test_consolidate_missing_column_ignores_extra_fields(self, temp_dir):
+        """Remapped parts leave absent columns blank, not a stray trailing field."""
+        csv1 = temp_dir / "part1.csv"
+        csv2 = temp_dir / "part2.csv"
+        output = temp_dir / "consolidated.csv"
+
+        csv1.write_text(
+            "filename,originalCreationDate,fileChecksum\nIMG_1.HEIC,d1,h1\n"
+        )
+        csv2.write_text("fileChecksum,filename\nh2,IMG_2.HEIC,stray\n")
+
+        consolidate_csvs([csv1, csv2], output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[2] == ["IMG_2.HEIC", "", "h2"]
+
+    def test_consolidate_duplicates_within_and_across_parts(self, temp_dir):
+        """Only each filename's final row survives, wherever it appears."""
+        csv1 = temp_dir / "part1.csv"
+        csv2 = temp_dir / "part2.csv"
+        output = temp_dir / "consolidated.csv"
+
+        csv1.write_text(
+            "filename,fileChecksum\n"
+            "IMG_1.HEIC,a1\n"
+            "IMG_2.HEIC,b1\n"
+            "IMG_1.HEIC,a2\n"
+            ",orphan\n"
+        )
+        csv2.write_text("filename,fileChecksum\nIMG_2.HEIC,b2\nIMG_3.HEIC,c1\n")
+
+        consolidate_csvs([csv1, csv2], output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["filename", "fileChecksum"],
+            ["IMG_1.HEIC", "a2"],
+            ["IMG_2.HEIC", "b2"],
+            ["IMG_3.HEIC", "c1"],
+        ]
+
+    def test_consolidate_keeps_first_appearance_order(self, temp_dir):
+        """A repeated filename stays where it first appeared, with its last values."""
+        csv1 = temp_dir / "part1.csv"
+        csv2 = temp_dir / "part2.csv"
+        output = temp_dir / "consolidated.csv"
+
+        csv1.write_text("filename,fileChecksum\nA.HEIC,a1\nB.HEIC,b1\n")
+        csv2.write_text("filename,fileChecksum\nC.HEIC,c1\nA.HEIC,a2\n")
+
+        consolidate_csvs([csv1, csv2], output)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["filename", "fileChecksum"],
+            ["A.HEIC", "a2"],
+            ["B.HEIC", "b1"],
+            ["C.HEIC", "c1"],
+        ]
+
+    def test_consolidate_matches_dict_merge(self, temp_dir):
+        """Column and row order match the original dict-based merge.
+
+        Parts overlap and disagree on headers: the first readable header has
+        no rows but sets the columns, later parts reorder or omit columns.
+        """
+        parts = [
+            "filename,originalCreationDate,fileChecksum,importDate\n",
+            "fileChecksum,filename,originalCreationDate\n"
+            "a1,A.HEIC,d1\nb1,B.HEIC,d2\n,,\nc1,C.HEIC,d3\n",
+            "filename,fileChecksum\nD.HEIC,d4\nB.HEIC,b2\nA.HEIC,a2\n",
+            "importDate,filename,originalCreationDate,fileChecksum\n"
+            "i1,E.HEIC,d5,e1\ni2,A.HEIC,d6,a3\ni3,D.HEIC\n",
+        ]
+        csv_paths = [temp_dir / "missing.csv"]
+        for i, text in enumerate(parts):
+            csv_paths.append(temp_dir / f"part{i}.csv")
+            csv_paths[-1].write_text(text)
+
+        output = temp_dir / "consolidated.csv"
+        expected = temp_dir / "expected.csv"
+        consolidate_csvs(csv_paths, output)
+        _dict_consolidate(csv_paths, expected)
+
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == [
+            "filename",
+            "originalCreationDate",
+            "fileChecksum",
+            "importDate",
+        ]
+        assert [row[0] for row in rows[1:]] == [
+            "A.HEIC",
+            "B.HEIC",
+            "C.HEIC",
+            "D.HEIC",
+            "E.HEIC",
+        ]
+        assert output.read_text() == expected.read_text()
+
     def test_consolidate_empty_list(self, temp_dir):
         """Empty CSV list should raise ValueError."""
         output = temp_dir / "output.csv"
@@ -305,18 +512,16 @@ class TestCSVConsolidation:
         output = temp_dir / "output.csv"
 
         # Create only first CSV
-        with open(csv1, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerow(
+        _write_details_csv(
+            csv1,
+            [
                 {
                     "filename": "IMG_1001.HEIC",
                     "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
                     "fileChecksum": "hash1",
                 }
-            )
+            ],
+        )
 
         # Consolidate (should skip missing file)
         consolidate_csvs([csv1, csv2], output)
@@ -339,46 +544,38 @@ class TestIntegration:
         part2.parent.mkdir(parents=True)
 
         # Part 1 CSV
-        with open(part1, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerows(
-                [
-                    {
-                        "filename": "IMG_1001.HEIC",
-                        "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
-                        "fileChecksum": "hash1",
-                    },
-                    {
-                        "filename": "IMG_1002.HEIC",
-                        "originalCreationDate": "Tuesday January 2,2025 2:30 PM GMT",
-                        "fileChecksum": "hash2",
-                    },
-                ]
-            )
+        _write_details_csv(
+            part1,
+            [
+                {
+                    "filename": "IMG_1001.HEIC",
+                    "originalCreationDate": "Monday January 1,2025 10:00 AM GMT",
+                    "fileChecksum": "hash1",
+                },
+                {
+                    "filename": "IMG_1002.HEIC",
+                    "originalCreationDate": "Tuesday January 2,2025 2:30 PM GMT",
+                    "fileChecksum": "hash2",
+                },
+            ],
+        )
 
         # Part 2 CSV
-        with open(part2, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["filename", "originalCreationDate", "fileChecksum"]
-            )
-            writer.writeheader()
-            writer.writerows(
-                [
-                    {
-                        "filename": "IMG_2001.HEIC",
-                        "originalCreationDate": "Wednesday January 3,2025 11:00 AM GMT",
-                        "fileChecksum": "hash3",
-                    },
-                    {
-                        "filename": "Screenshot_1234.png",
-                        "originalCreationDate": "Thursday January 4,2025 4:15 PM GMT",
-                        "fileChecksum": "hash4",
-                    },
-                ]
-            )
+        _write_details_csv(
+            part2,
+            [
+                {
+                    "filename": "IMG_2001.HEIC",
+                    "originalCreationDate": "Wednesday January 3,2025 11:00 AM GMT",
+                    "fileChecksum": "hash3",
+                },
+                {
+                    "filename": "Screenshot_1234.png",
+                    "originalCreationDate": "Thursday January 4,2025 4:15 PM GMT",
+                    "fileChecksum": "hash4",
+                },
+            ],
+        )
 
         # Consolidate
         output = temp_dir / "consolidated.csv"
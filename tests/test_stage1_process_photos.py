@@ -0,0 +1,78 @@
+"""Tests for the Stage 1 processing pipeline.
+
+Tests cover:
+- Re-runs don't report already stored images as new
+- Rows skipped by the insert's conflict handling count as skipped
+
+Author: Leonardo
+Version: v0.1.0
+"""
+
+from datetime import datetime
+
+from orchestration import stage1_process_photos
+from orchestration.stage1_process_photos import process_photos
+
+
+def _make_images(source_dir, count):
+    """Write count small JPEGs with distinct EXIF dates into source_dir."""
+    from PIL import Image
+
+    source_dir.mkdir()
+    for i in range(count):
+        exif = Image.Exif()
+        exif[0x0132] = datetime(2024, 1, 1, 12, 0, i).strftime("%Y:%m:%d %H:%M:%S")
+        Image.new("RGB", (8, 8)).save(source_dir / f"IMG_{i}.jpg", exif=exif)
+
+
+def _summary(output):
+    """Map summary labels ('New images', ...) to their counts."""
+    counts = {}
+    for line in output.splitlines():
+        label, sep, value = line.rpartition(":")
+        if sep and value.strip().isdigit():
+            counts[label.strip(" ✅⏭️❌📊")] = int(value)
+    return counts
+
+
+class TestProcessPhotosRerun:
+    """Test that re-running Stage 1 reports no duplicates as new."""
+
+    def test_second_run_reports_no_new_images(self, temp_dir, temp_db, capsys):
+        """A second run over the same source should report 0 new images."""
+        source_dir = temp_dir / "source"
+        output_dir = temp_dir / "organized"
+        _make_images(source_dir, 3)
+
+        process_photos(source_dir, output_dir, temp_db)
+        first = _summary(capsys.readouterr().out)
+        process_photos(source_dir, output_dir, temp_db)
+        second = _summary(capsys.readouterr().out)
+
+        assert first["New images"] == 3
+        assert second["New images"] == 0
+        assert second["Skipped (already processed)"] == 3
+        assert second["Total in database"] == 3
+
+    def test_conflicting_inserts_count_as_skipped(
+        self, temp_dir, temp_db, capsys, monkeypatch
+    ):
+        """Rows the insert skips as duplicates shouldn't count as new.
+
+        Simulates rows stored after the already-processed set was loaded
+        (e.g. by a concurrent run) by hiding them from that preload.
+        """
+        source_dir = temp_dir / "source"
+        output_dir = temp_dir / "organized"
+        _make_images(source_dir, 3)
+
+        process_photos(source_dir, output_dir, temp_db)
+        capsys.readouterr()
+        monkeypatch.setattr(
+            stage1_process_photos, "load_processed_paths", lambda conn: set()
+        )
+        process_photos(source_dir, output_dir, temp_db)
+        second = _summary(capsys.readouterr().out)
+
+        assert second["New images"] == 0
+        assert second["Skipped (already processed)"] == 3